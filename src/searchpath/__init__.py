@@ -12,6 +12,7 @@ from searchpath._exceptions import (
 from searchpath._functions import all, first, match, matches  # noqa: A004
 from searchpath._match import Match
 from searchpath._matchers import (
+    BatchPathMatcher,
     GitignoreMatcher,
     GlobMatcher,
     PathMatcher,
@@ -22,6 +23,7 @@ from searchpath._searchpath import Entry, SearchPath
 __version__ = version("searchpath")
 
 __all__ = [
+    "BatchPathMatcher",
     "ConfigurationError",
     "Entry",
     "GitignoreMatcher",
@@ -1,15 +1,16 @@
 """Ancestor pattern loading for hierarchical pattern files."""
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import functools
+import os
+import sys
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from pathlib import Path
 
 
-@dataclass(frozen=True, slots=True)
-class AncestorPatterns:
+class AncestorPatterns(NamedTuple):
     """Patterns collected from ancestor directories.
 
     Attributes:
@@ -21,10 +22,34 @@ class AncestorPatterns:
     exclude: tuple[str, ...]
 
 
-def _load_patterns_lenient(
-    path: "Path",
-    cache: dict["Path", list[str]] | None,
-) -> list[str]:
+EMPTY_ANCESTOR_PATTERNS = AncestorPatterns(include=(), exclude=())
+"""Shared result for lookups that find no ancestor patterns.
+
+collect_ancestor_patterns returns this exact instance whenever nothing was
+collected, so callers can test ``result is EMPTY_ANCESTOR_PATTERNS`` and
+skip pattern merging entirely.
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def _intern_patterns(patterns: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the canonical tuple for a pattern tuple.
+
+    Sibling files share ancestors and therefore produce identical pattern
+    lists. Interning the tuples means they share one object, which saves
+    memory and lets equality checks on them succeed by identity. The cache
+    is bounded, so long-running processes don't keep every tuple alive.
+
+    Args:
+        patterns: Patterns collected from ancestor directories.
+
+    Returns:
+        A tuple equal to patterns, shared with recent equal results.
+    """
+    return patterns
+
+
+def _load_patterns_lenient(path: "Path") -> list[str]:
     """Load patterns from a file with lenient error handling.
 
     Unlike load_patterns from _traversal, this function silently returns
@@ -33,34 +58,83 @@ def _load_patterns_lenient(
 
     Args:
         path: Path to the pattern file.
-        cache: Optional dict for caching loaded patterns by file path.
 
     Returns:
         List of patterns from the file, or empty list if file is missing
         or unreadable.
     """
-    if cache is not None and path in cache:
-        return cache[path]
-
-    patterns: list[str] = []
     try:
         content = path.read_text(encoding="utf-8")
-        for line in content.splitlines():
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#"):
-                patterns.append(stripped)
     except (FileNotFoundError, PermissionError, IsADirectoryError, UnicodeDecodeError):
-        pass
+        return []
+
+    return [
+        sys.intern(stripped)
+        for line in content.splitlines()
+        if (stripped := line.strip()) and not stripped.startswith("#")
+    ]
+
+
+def _load_cached_patterns(
+    path: "Path",
+    cache: dict["Path", list[str]] | None,
+) -> list[str]:
+    """Load a pattern file leniently, reusing and filling the cache.
 
-    if cache is not None:
-        cache[path] = patterns
+    Args:
+        path: Path to the pattern file.
+        cache: Optional dict for caching loaded patterns by file path.
 
+    Returns:
+        List of patterns from the file, or empty list if file is missing
+        or unreadable.
+    """
+    if cache is None:
+        return _load_patterns_lenient(path)
+    patterns = cache.get(path)
+    if patterns is None:
+        patterns = cache[path] = _load_patterns_lenient(path)
     return patterns
 
 
+def _collect_pattern_file(
+    ancestors: "Sequence[Path]",
+    filename: str | None,
+    cache: dict["Path", list[str]] | None,
+) -> list[str]:
+    """Concatenate the patterns of one pattern file across ancestors.
+
+    Each file is probed by opening it directly rather than by listing the
+    directory. A listing would cost time proportional to the directory
+    size and would need read permission on it, while opening a known name
+    needs only search permission. Missing files are cached as empty lists
+    so later lookups skip them.
+
+    Args:
+        ancestors: Directories to load from, in root-to-leaf order.
+        filename: Pattern filename to load, or None to load nothing.
+        cache: Optional dict for caching loaded patterns by file path.
+
+    Returns:
+        Patterns from every ancestor's file, parent patterns first.
+    """
+    if filename is None:
+        return []
+    return [
+        pattern
+        for directory in ancestors
+        for pattern in _load_cached_patterns(directory / filename, cache)
+    ]
+
+
 def _collect_ancestor_dirs(file_path: "Path", entry_root: "Path") -> list["Path"]:
     """Collect ancestor directories from entry_root to file's parent.
 
+    The containment check compares the string forms of the paths instead of
+    calling Path.relative_to, which keeps the per-file cost to a prefix test.
+    Both paths are expected in the same normalized form (as produced by
+    resolve() and traversal).
+
     Args:
         file_path: The matched file's absolute path.
         entry_root: The search path entry directory (boundary).
@@ -70,14 +144,18 @@ def _collect_ancestor_dirs(file_path: "Path", entry_root: "Path") -> list["Path"
         in root-to-leaf order. Returns empty list if file_path is not
         under entry_root.
     """
-    try:
-        relative = file_path.parent.relative_to(entry_root)
-    except ValueError:
+    root_str = os.fspath(entry_root)
+    parent_str = os.fspath(file_path.parent)
+    if parent_str == root_str:
+        return [entry_root]
+
+    prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+    if not parent_str.startswith(prefix):
         return []
 
     ancestors: list[Path] = [entry_root]
     current = entry_root
-    for part in relative.parts:
+    for part in parent_str[len(prefix) :].split(os.sep):  # noqa: PTH206
         current = current / part
         ancestors.append(current)
 
@@ -112,25 +190,18 @@ def collect_ancestor_patterns(
         child patterns last).
     """
     if include_filename is None and exclude_filename is None:
-        return AncestorPatterns(include=(), exclude=())
+        return EMPTY_ANCESTOR_PATTERNS
 
     ancestors = _collect_ancestor_dirs(file_path, entry_root)
+    include_patterns = _collect_pattern_file(ancestors, include_filename, cache)
+    exclude_patterns = _collect_pattern_file(ancestors, exclude_filename, cache)
 
-    include_patterns: list[str] = []
-    exclude_patterns: list[str] = []
-
-    for ancestor_dir in ancestors:
-        if include_filename is not None:
-            pattern_file = ancestor_dir / include_filename
-            include_patterns.extend(_load_patterns_lenient(pattern_file, cache))
-
-        if exclude_filename is not None:
-            pattern_file = ancestor_dir / exclude_filename
-            exclude_patterns.extend(_load_patterns_lenient(pattern_file, cache))
+    if not include_patterns and not exclude_patterns:
+        return EMPTY_ANCESTOR_PATTERNS
 
     return AncestorPatterns(
-        include=tuple(include_patterns),
-        exclude=tuple(exclude_patterns),
+        include=_intern_patterns(tuple(include_patterns)),
+        exclude=_intern_patterns(tuple(exclude_patterns)),
     )
 
 
@@ -153,7 +224,7 @@ def merge_patterns(
         Merged pattern list with ancestors first, inline patterns last.
     """
     if not ancestor_patterns:
-        return list(inline_patterns) if inline_patterns else []
+        return list(inline_patterns)
     if not inline_patterns:
         return list(ancestor_patterns)
     return [*ancestor_patterns, *inline_patterns]
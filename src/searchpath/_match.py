@@ -1,5 +1,6 @@
 """Match dataclass for search path results."""
 
+import os
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -7,6 +8,23 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
+def relative_path_str(path: str, source: str) -> str | None:
+    """Slice the part of a path string below a source directory string.
+
+    Args:
+        path: The path as a string.
+        source: The directory the path should lie under, as a string.
+
+    Returns:
+        The remainder of path after source and its separator, or None if
+        path does not start with source as a directory prefix.
+    """
+    prefix = source if source.endswith(os.sep) else source + os.sep
+    if path.startswith(prefix):
+        return path[len(prefix) :]
+    return None
+
+
 @dataclass(frozen=True, slots=True)
 class Match:
     """Result of a search path lookup.
@@ -46,7 +64,13 @@ class Match:
     def relative(self) -> "Path":
         """Path relative to the source directory.
 
+        Computed on each access by slicing the path string, without a cache
+        field, so the public dataclass fields stay path, scope and source.
+
         Returns:
             The path of this match relative to its source directory.
         """
+        sliced = relative_path_str(os.fspath(self.path), os.fspath(self.source))
+        if sliced is not None:
+            return type(self.path)(sliced)
         return self.path.relative_to(self.source)
@@ -1,29 +1,147 @@
 """Pattern matchers for searchpath."""
 
+import functools
 import re
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol, final
+from typing import (
+    TYPE_CHECKING,
+    Literal,
+    Protocol,
+    TypeAlias,
+    final,
+    runtime_checkable,
+)
 
 from searchpath._exceptions import PatternSyntaxError
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from pathspec import GitIgnoreSpec
 
+    _RegexMatch: TypeAlias = Callable[[str, int], re.Match[str] | None]
+
+GitignoreBackend: TypeAlias = Literal["best", "hyperscan", "re2", "simple"]
+"""Names of the pathspec backends accepted by GitignoreMatcher."""
+
 
 @final
 @dataclass(frozen=True, slots=True)
-class _CompiledPattern:
-    """A compiled pattern ready for matching (internal).
+class _GlobSet:
+    """A compiled list of glob patterns (internal).
+
+    Patterns with a common simple shape are answered with plain string
+    operations; only the remaining patterns go through the regex engine.
 
     Attributes:
-        regex: The compiled regular expression.
-        pattern: The original pattern string.
+        literals: Patterns without wildcards, compared for equality.
+        prefixes: Literals of ``LITERAL*`` patterns without ``/``.
+        suffixes: Literals of ``*LITERAL`` patterns without ``/``.
+        basenames: Literals of ``**/LITERAL`` patterns without ``/``.
+        affixes: Whether there are any prefix, suffix or basename patterns.
+        regexes: Fused regexes for all other patterns, grouped by the literal
+            directory prefix the patterns start with. Each entry holds the
+            prefix and the bound match method that checks the remainder of
+            the path after it.
+        literals_only: Whether every pattern is a literal, so that the set
+            lookup alone decides a match.
     """
 
-    regex: re.Pattern[str]
-    pattern: str
+    literals: frozenset[str]
+    prefixes: tuple[str, ...]
+    suffixes: tuple[str, ...]
+    basenames: frozenset[str]
+    affixes: bool
+    regexes: "tuple[tuple[str, _RegexMatch], ...]"
+    literals_only: bool
+
+    def fullmatch(self, path: str) -> bool:
+        """Check whether any pattern in the set matches the whole path.
+
+        Args:
+            path: Relative path from search root (forward slashes).
+
+        Returns:
+            True if at least one pattern matches.
+        """
+        if path in self.literals:
+            return True
+        if self.literals_only:
+            return False
+        if self.affixes and self._affix_fullmatch(path):
+            return True
+        return any(
+            path.startswith(prefix) and match(path, len(prefix)) is not None
+            for prefix, match in self.regexes
+        )
+
+    def _affix_fullmatch(self, path: str) -> bool:
+        """Check the prefix, suffix and basename patterns against a path.
+
+        ``LITERAL*`` and ``*LITERAL`` do not cross ``/``, so they only apply
+        to paths in the search root.
+        """
+        _, sep, name = path.rpartition("/")
+        if name in self.basenames:
+            return True
+        return not sep and (
+            path.startswith(self.prefixes) or path.endswith(self.suffixes)
+        )
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class _RegexSet:
+    """A compiled list of regex patterns (internal).
+
+    Attributes:
+        literals: Strings matched by patterns without metacharacters,
+            compared for equality.
+        prefixes: Literals of ``LITERAL.*`` patterns.
+        suffixes: Literals of ``.*LITERAL`` patterns.
+        regexes: All other patterns: a single fused alternation when they
+            can be fused, otherwise one compiled regex per pattern.
+        cost: Rough cost of checking a path: 0 for a set lookup only, 1 if
+            string prefix or suffix checks are needed, 2 if a regex runs.
+    """
+
+    literals: frozenset[str]
+    prefixes: tuple[str, ...]
+    suffixes: tuple[str, ...]
+    regexes: "tuple[re.Pattern[str], ...]"
+    cost: int
+
+    def fullmatch(self, path: str) -> bool:
+        """Check whether any pattern in the set matches the whole path.
+
+        Args:
+            path: Relative path from search root (forward slashes).
+
+        Returns:
+            True if at least one pattern matches.
+        """
+        if path in self.literals:
+            return True
+        if "\n" not in path:
+            if path.startswith(self.prefixes) or path.endswith(self.suffixes):
+                return True
+        elif self._affix_fullmatch(path):
+            return True
+        return any(regex.fullmatch(path) for regex in self.regexes)
+
+    def _affix_fullmatch(self, path: str) -> bool:
+        """Check the prefix and suffix patterns against a path with newlines.
+
+        ``.`` does not match a newline, so the part of the path covered by
+        ``.*`` must not contain one.
+        """
+        return any(
+            path.startswith(prefix) and "\n" not in path[len(prefix) :]
+            for prefix in self.prefixes
+        ) or any(
+            path.endswith(suffix) and "\n" not in path[: len(path) - len(suffix)]
+            for suffix in self.suffixes
+        )
 
 
 class PathMatcher(Protocol):  # pragma: no cover
@@ -76,6 +194,375 @@ class PathMatcher(Protocol):  # pragma: no cover
         ...
 
 
+@runtime_checkable
+class BatchPathMatcher(PathMatcher, Protocol):  # pragma: no cover
+    """Protocol for path matchers that can check many paths at once.
+
+    Traversal matches each directory's entries with a single matches_many()
+    call when the matcher implements this protocol, and calls matches() per
+    path otherwise. GlobMatcher and RegexMatcher implement it.
+
+    Example:
+        ```python
+        matcher = GlobMatcher()
+        isinstance(matcher, BatchPathMatcher)  # True
+        matcher.matches_many(["a.py", "b.txt"], include=["*.py"])  # [True, False]
+        ```
+    """
+
+    def matches_many(
+        self,
+        paths: "Sequence[str]",
+        *,
+        is_dir: bool = False,
+        include: "Sequence[str]" = (),
+        exclude: "Sequence[str]" = (),
+    ) -> "Sequence[bool]":
+        """Check a batch of paths against the same include/exclude patterns.
+
+        Must return the same flags as calling matches() for each path.
+
+        Args:
+            paths: Relative paths from search root (forward slashes).
+            is_dir: Whether the paths represent directories.
+            include: Patterns a path must match (empty = match all).
+            exclude: Patterns that reject a path.
+
+        Returns:
+            One flag per path, True if that path should be included.
+        """
+        ...
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_glob(pattern: str) -> "re.Pattern[str] | PatternSyntaxError":
+    """Compile a glob pattern, caching the result process-wide.
+
+    Invalid patterns are cached as well: the error is returned instead of
+    raised, so a bad pattern checked against many paths is parsed only once.
+    Callers raise a fresh copy of the returned error.
+
+    Args:
+        pattern: The glob pattern string to compile.
+
+    Returns:
+        The compiled regex, or the PatternSyntaxError describing why the
+        pattern is invalid.
+    """
+    if not pattern:
+        return PatternSyntaxError(pattern, "empty pattern")
+
+    try:
+        regex_str = _glob_to_regex(pattern)
+    except PatternSyntaxError as e:
+        return e.with_traceback(None)
+
+    return re.compile(regex_str)
+
+
+def _checked_glob(pattern: str) -> "re.Pattern[str]":
+    """Return the compiled regex for a glob, raising if the glob is invalid.
+
+    Args:
+        pattern: The glob pattern string to compile.
+
+    Returns:
+        The compiled regex.
+
+    Raises:
+        PatternSyntaxError: If the pattern is empty or has unclosed brackets.
+    """
+    compiled = _compile_glob(pattern)
+    if isinstance(compiled, PatternSyntaxError):
+        raise PatternSyntaxError(compiled.pattern, compiled.message, compiled.position)
+    return compiled
+
+
+_GLOB_METACHARS = frozenset("*?[")
+
+_GlobShape: TypeAlias = Literal["literal", "prefix", "suffix", "basename", "grouped"]
+"""Shapes of glob patterns, from the cheapest check to the regex engine."""
+
+
+def _is_literal(text: str) -> bool:
+    """Check whether a glob fragment contains no wildcards or separators."""
+    return "/" not in text and _GLOB_METACHARS.isdisjoint(text)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob_set(patterns: tuple[str, ...]) -> _GlobSet:
+    """Compile glob patterns into a single matcher.
+
+    Patterns of the shapes ``LITERAL``, ``LITERAL*``, ``*LITERAL`` and
+    ``**/LITERAL`` become string comparisons. Everything else is grouped by
+    its literal leading directories (``src/``, ``docs/api/``) and each group
+    is fused into one alternation regex over the rest of the pattern. A path
+    only reaches the regex engine for groups whose prefix it starts with.
+
+    Args:
+        patterns: The glob patterns to compile, in order.
+
+    Returns:
+        A matcher that accepts a path iff any of the patterns does.
+
+    Raises:
+        PatternSyntaxError: For the first pattern that is invalid.
+    """
+    shapes: dict[_GlobShape, list[str]] = {
+        "literal": [],
+        "prefix": [],
+        "suffix": [],
+        "basename": [],
+    }
+    grouped: dict[str, list[str]] = {}
+
+    for pattern in patterns:
+        # Validate every pattern, even those answered without a regex
+        _ = _checked_glob(pattern)
+        shape, literal = _glob_shape(pattern)
+        if shape != "grouped":
+            shapes[shape].append(literal)
+            continue
+        prefix = _literal_dir_prefix(pattern)
+        remainder = _checked_glob(pattern[len(prefix) :])
+        grouped.setdefault(prefix, []).append(remainder.pattern)
+
+    return _GlobSet(
+        literals=frozenset(shapes["literal"]),
+        prefixes=tuple(shapes["prefix"]),
+        suffixes=tuple(shapes["suffix"]),
+        basenames=frozenset(shapes["basename"]),
+        affixes=bool(shapes["prefix"] or shapes["suffix"] or shapes["basename"]),
+        regexes=tuple(
+            (prefix, _fuse_regexes(regexes)) for prefix, regexes in grouped.items()
+        ),
+        literals_only=len(shapes["literal"]) == len(patterns),
+    )
+
+
+def _glob_shape(pattern: str) -> tuple[_GlobShape, str]:
+    """Classify a glob by the string comparison that can answer it.
+
+    Args:
+        pattern: A valid glob pattern.
+
+    Returns:
+        The shape of the pattern and its literal part. Patterns that need
+        the regex engine are ``"grouped"`` and returned unchanged.
+    """
+    if _GLOB_METACHARS.isdisjoint(pattern):
+        return "literal", pattern
+    if pattern.endswith("*") and _is_literal(pattern[:-1]):
+        return "prefix", pattern[:-1]
+    if pattern.startswith("*") and _is_literal(pattern[1:]):
+        return "suffix", pattern[1:]
+    if pattern.startswith("**/") and _is_literal(pattern[3:]):
+        return "basename", pattern[3:]
+    return "grouped", pattern
+
+
+def _literal_dir_prefix(pattern: str) -> str:
+    """Return the leading directories of a glob that contain no wildcards.
+
+    Args:
+        pattern: The glob pattern to inspect.
+
+    Returns:
+        The literal prefix including its trailing ``/``, or an empty string
+        if the first path component already contains a wildcard.
+    """
+    head, sep, _ = pattern.rpartition("/")
+    while sep and not _GLOB_METACHARS.isdisjoint(head):
+        head, sep, _ = head.rpartition("/")
+    return head + sep
+
+
+def _fuse_regexes(regexes: list[str]) -> "_RegexMatch":
+    """Compile regex strings into a single alternation.
+
+    Args:
+        regexes: Translated glob regexes to fuse.
+
+    Returns:
+        The bound fullmatch() to call with a path and start position.
+    """
+    if len(regexes) == 1:
+        return re.compile(regexes[0]).fullmatch
+    return re.compile("|".join(f"(?:{regex})" for regex in regexes)).fullmatch
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a glob pattern to a regex string.
+
+    Args:
+        pattern: The glob pattern to translate.
+
+    Returns:
+        A regex string equivalent to the glob pattern.
+
+    Raises:
+        PatternSyntaxError: If the pattern has unclosed brackets.
+    """
+    result: list[str] = []
+    i = 0
+    n = len(pattern)
+
+    while i < n:
+        handler = _WILDCARD_TRANSLATORS.get(pattern[i])
+        if handler is not None:
+            i = handler(pattern, i, n, result)
+            continue
+
+        # Copy the literal run up to the next wildcard in one step
+        wildcard = _GLOB_WILDCARD.search(pattern, i)
+        end = n if wildcard is None else wildcard.start()
+        result.append(pattern[i:end].translate(_LITERAL_ESCAPES))
+        i = end
+
+    return "".join(result)
+
+
+def _translate_star(pattern: str, i: int, n: int, result: list[str]) -> int:
+    """Translate * or ** glob pattern to regex.
+
+    Gitignore-style semantics: ** is only recursive when it's a complete
+    path component (bounded by / or string start/end). Otherwise ** is
+    treated as a single * (matches anything except /).
+    """
+    # Single star - matches anything except /
+    if i + 1 >= n or pattern[i + 1] != "*":
+        result.append("[^/]*")
+        return i + 1
+
+    # Double star - check if it's a complete path component
+    return _translate_double_star(pattern, i, n, result)
+
+
+def _translate_double_star(pattern: str, i: int, n: int, result: list[str]) -> int:
+    """Translate ** pattern, checking if it's a complete path component."""
+    next_pos = i + 2
+    at_start = i == 0
+    at_end = next_pos >= n
+    after_slash = i > 0 and pattern[i - 1] == "/"
+    before_slash = next_pos < n and pattern[next_pos] == "/"
+
+    is_component = (at_start or after_slash) and (at_end or before_slash)
+
+    if not is_component:
+        # ** not a complete component (e.g., a**b) - treat as single *
+        result.append("[^/]*")
+        return next_pos
+
+    # ** as complete path component - recursive match
+    if before_slash:
+        # **/ - match zero or more path segments including trailing slash
+        result.append("(?:.*/)?")
+        return next_pos + 1
+    # ** at end - match anything (zero or more of any char)
+    result.append(".*")
+    return next_pos
+
+
+def _translate_question(pattern: str, i: int, n: int, result: list[str]) -> int:
+    """Translate ? to a regex matching one character except /."""
+    del pattern, n  # Uniform signature for _WILDCARD_TRANSLATORS
+    result.append("[^/]")
+    return i + 1
+
+
+def _translate_bracket(pattern: str, i: int, n: int, result: list[str]) -> int:
+    """Translate a character class [...] to regex.
+
+    Args:
+        pattern: The full pattern string.
+        i: Current position (pointing to '[').
+        n: Length of pattern.
+        result: List to append regex parts to.
+
+    Returns:
+        New position after the closing ']'.
+
+    Raises:
+        PatternSyntaxError: If the bracket is unclosed.
+    """
+    bracket_start = i
+    i += 1
+
+    if i >= n:
+        raise PatternSyntaxError(pattern, "unclosed bracket", position=bracket_start)
+
+    # Check for negation at start
+    # Gitignore-style: negated classes should also exclude /
+    if pattern[i] in "!^":
+        result.append("[^/")
+        i += 1
+    else:
+        result.append("[")
+
+    if i >= n:
+        raise PatternSyntaxError(pattern, "unclosed bracket", position=bracket_start)
+
+    # Handle ] as first character in class (literal ])
+    if pattern[i] == "]":
+        result.append("]")
+        i += 1
+
+    # Collect characters until closing ]
+    i = _collect_bracket_contents(pattern, i, n, result)
+
+    if i >= n:
+        raise PatternSyntaxError(pattern, "unclosed bracket", position=bracket_start)
+
+    result.append("]")
+    return i + 1
+
+
+def _collect_bracket_contents(pattern: str, i: int, n: int, result: list[str]) -> int:
+    """Collect contents of a character class until closing ']'."""
+    while i < n and pattern[i] != "]":
+        char = pattern[i]
+        if char == "\\":
+            i = _handle_bracket_escape(pattern, i, n, result)
+        elif char == "-":
+            result.append("-")
+            i += 1
+        else:
+            _handle_bracket_char(char, result)
+            i += 1
+    return i
+
+
+def _handle_bracket_escape(pattern: str, i: int, n: int, result: list[str]) -> int:
+    """Handle backslash escape inside bracket expression."""
+    result.append("\\")
+    i += 1
+    if i < n:
+        result.append(pattern[i])
+        i += 1
+    return i
+
+
+def _handle_bracket_char(char: str, result: list[str]) -> None:
+    """Handle a regular character inside bracket expression."""
+    if char in r"\^-]":
+        result.append("\\")
+    result.append(char)
+
+
+_WILDCARD_TRANSLATORS: "dict[str, Callable[[str, int, int, list[str]], int]]" = {
+    "*": _translate_star,
+    "?": _translate_question,
+    "[": _translate_bracket,
+}
+"""Translators for glob wildcards, keyed by the character that starts them."""
+
+_GLOB_WILDCARD = re.compile(r"[*?\[]")
+"""Finds the next wildcard, ending a run of literal characters."""
+
+_LITERAL_ESCAPES = str.maketrans({c: "\\" + c for c in r"\.+^${}()|"})
+"""Escapes regex metacharacters in literal runs of a glob."""
+
+
 @final
 class GlobMatcher:
     """Path matcher using glob-style patterns.
@@ -105,29 +592,13 @@ class GlobMatcher:
         ```
     """
 
-    __slots__ = ("_cache",)
+    __slots__ = ()
 
-    def __init__(self) -> None:
-        """Initialize the matcher with an empty pattern cache."""
-        self._cache: dict[str, _CompiledPattern] = {}
+    supports_negation: bool = False
+    """Whether this matcher supports negation patterns."""
 
-    @property
-    def supports_negation(self) -> bool:
-        """Whether this matcher supports negation patterns.
-
-        Returns:
-            Always False for GlobMatcher.
-        """
-        return False
-
-    @property
-    def supports_dir_only(self) -> bool:
-        """Whether this matcher supports directory-only patterns.
-
-        Returns:
-            Always False for GlobMatcher.
-        """
-        return False
+    supports_dir_only: bool = False
+    """Whether this matcher supports directory-only patterns."""
 
     def matches(
         self,
@@ -164,223 +635,249 @@ class GlobMatcher:
         """
         del is_dir  # Unused by GlobMatcher (no dir_only support)
 
+        if not include and not exclude:
+            return True
+
         # Check include patterns (empty = match all)
-        if include:
-            included = any(self._match_pattern(path, p) for p in include)
-            if not included:
-                return False
+        if include and not _compile_glob_set(tuple(include)).fullmatch(path):
+            return False
 
         # Check exclude patterns
-        if exclude:
-            excluded = any(self._match_pattern(path, p) for p in exclude)
-            if excluded:
-                return False
+        return not (exclude and _compile_glob_set(tuple(exclude)).fullmatch(path))
 
-        return True
+    def matches_many(
+        self,
+        paths: "Sequence[str]",
+        *,
+        is_dir: bool = False,
+        include: "Sequence[str]" = (),
+        exclude: "Sequence[str]" = (),
+    ) -> list[bool]:
+        """Check a batch of paths against the same include/exclude patterns.
 
-    def _match_pattern(self, path: str, pattern: str) -> bool:
-        """Test if a path matches a single pattern.
+        Equivalent to calling matches() for each path, but the pattern lists
+        are looked up once per batch instead of once per path.
 
         Args:
-            path: Relative path from search root.
-            pattern: Glob pattern to match against.
+            paths: Relative paths from search root (forward slashes).
+            is_dir: Whether the paths represent directories (ignored by
+                GlobMatcher).
+            include: Patterns a path must match (empty = match all).
+            exclude: Patterns that reject a path.
 
         Returns:
-            True if the path matches the pattern.
+            One flag per path, True if that path should be included.
+
+        Raises:
+            PatternSyntaxError: If any pattern has invalid syntax.
+
+        Example:
+            ```python
+            matcher = GlobMatcher()
+            matcher.matches_many(["a.py", "b.txt"], include=["*.py"])  # [True, False]
+            ```
         """
-        compiled = self._compile(pattern)
-        return compiled.regex.fullmatch(path) is not None
+        del is_dir  # Unused by GlobMatcher (no dir_only support)
 
-    def _compile(self, pattern: str) -> _CompiledPattern:
-        """Compile a glob pattern (with caching).
+        results = [True] * len(paths)
 
-        Args:
-            pattern: The glob pattern string to compile.
+        if include:
+            included = _compile_glob_set(tuple(include)).fullmatch
+            results = [included(path) for path in paths]
 
-        Returns:
-            A compiled pattern ready for matching.
+        if exclude:
+            excluded = _compile_glob_set(tuple(exclude)).fullmatch
+            results = [
+                ok and not excluded(path)
+                for ok, path in zip(results, paths, strict=True)
+            ]
 
-        Raises:
-            PatternSyntaxError: If the pattern is empty or has unclosed brackets.
-        """
-        if pattern in self._cache:
-            return self._cache[pattern]
+        return results
 
-        if not pattern:
-            raise PatternSyntaxError(pattern, "empty pattern")
 
-        regex_str = self._glob_to_regex(pattern)
-        regex = re.compile(regex_str)
+@functools.lru_cache(maxsize=512)
+def _compile_regex(pattern: str) -> "re.Pattern[str] | PatternSyntaxError":
+    """Compile a regex pattern, caching the result process-wide.
 
-        compiled = _CompiledPattern(regex=regex, pattern=pattern)
-        self._cache[pattern] = compiled
-        return compiled
+    Like _compile_glob, invalid patterns are cached as their error so that
+    a bad pattern checked against many paths is parsed only once.
 
-    def _glob_to_regex(self, pattern: str) -> str:
-        """Translate a glob pattern to a regex string.
+    Args:
+        pattern: The regex pattern string to compile.
 
-        Args:
-            pattern: The glob pattern to translate.
+    Returns:
+        The compiled regex, or the PatternSyntaxError describing why the
+        pattern is invalid.
+    """
+    if not pattern:
+        return PatternSyntaxError(pattern, "empty pattern")
 
-        Returns:
-            A regex string equivalent to the glob pattern.
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        error = PatternSyntaxError(pattern, str(e))
+        error.__cause__ = e.with_traceback(None)
+        return error
 
-        Raises:
-            PatternSyntaxError: If the pattern has unclosed brackets.
-        """
-        result: list[str] = []
-        i = 0
-        n = len(pattern)
-
-        while i < n:
-            c = pattern[i]
-
-            if c == "*":
-                i = self._translate_star(pattern, i, n, result)
-            elif c == "?":
-                result.append("[^/]")
-                i += 1
-            elif c == "[":
-                i = self._translate_bracket(pattern, i, n, result)
-            else:
-                self._translate_literal(c, result)
-                i += 1
-
-        return "".join(result)
-
-    def _translate_star(self, pattern: str, i: int, n: int, result: list[str]) -> int:
-        """Translate * or ** glob pattern to regex.
-
-        Gitignore-style semantics: ** is only recursive when it's a complete
-        path component (bounded by / or string start/end). Otherwise ** is
-        treated as a single * (matches anything except /).
-        """
-        # Single star - matches anything except /
-        if i + 1 >= n or pattern[i + 1] != "*":
-            result.append("[^/]*")
-            return i + 1
-
-        # Double star - check if it's a complete path component
-        return self._translate_double_star(pattern, i, n, result)
-
-    def _translate_double_star(
-        self, pattern: str, i: int, n: int, result: list[str]
-    ) -> int:
-        """Translate ** pattern, checking if it's a complete path component."""
-        next_pos = i + 2
-        at_start = i == 0
-        at_end = next_pos >= n
-        after_slash = i > 0 and pattern[i - 1] == "/"
-        before_slash = next_pos < n and pattern[next_pos] == "/"
-
-        is_component = (at_start or after_slash) and (at_end or before_slash)
-
-        if not is_component:
-            # ** not a complete component (e.g., a**b) - treat as single *
-            result.append("[^/]*")
-            return next_pos
-
-        # ** as complete path component - recursive match
-        if before_slash:
-            # **/ - match zero or more path segments including trailing slash
-            result.append("(?:.*/)?")
-            return next_pos + 1
-        # ** at end - match anything (zero or more of any char)
-        result.append(".*")
-        return next_pos
 
-    def _translate_literal(self, c: str, result: list[str]) -> None:
-        """Translate a literal character, escaping regex metacharacters."""
-        if c in r"\.+^${}()|":
-            result.append("\\")
-        result.append(c)
+def _checked_regex(pattern: str) -> "re.Pattern[str]":
+    """Return the compiled regex for a pattern, raising if it is invalid.
 
-    def _translate_bracket(
-        self, pattern: str, i: int, n: int, result: list[str]
-    ) -> int:
-        """Translate a character class [...] to regex.
+    Args:
+        pattern: The regex pattern string to compile.
 
-        Args:
-            pattern: The full pattern string.
-            i: Current position (pointing to '[').
-            n: Length of pattern.
-            result: List to append regex parts to.
+    Returns:
+        The compiled regex.
 
-        Returns:
-            New position after the closing ']'.
+    Raises:
+        PatternSyntaxError: If the pattern is empty or has invalid syntax.
+    """
+    compiled = _compile_regex(pattern)
+    if isinstance(compiled, PatternSyntaxError):
+        raise PatternSyntaxError(
+            compiled.pattern, compiled.message, compiled.position
+        ) from compiled.__cause__
+    return compiled
 
-        Raises:
-            PatternSyntaxError: If the bracket is unclosed.
-        """
-        bracket_start = i
-        i += 1
 
-        if i >= n:
-            raise PatternSyntaxError(
-                pattern, "unclosed bracket", position=bracket_start
-            )
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?\(\d")
+"""Finds numbered backreferences, which fusing would renumber."""
 
-        # Check for negation at start
-        # Gitignore-style: negated classes should also exclude /
-        if pattern[i] in "!^":
-            result.append("[^/")
-            i += 1
-        else:
-            result.append("[")
+_REGEX_LITERAL = re.compile(r"(?:[^.^$*+?()\[\]{}|\\]|\\\W)+")
+"""Matches regexes with no metacharacters except escaped punctuation."""
 
-        if i >= n:
-            raise PatternSyntaxError(
-                pattern, "unclosed bracket", position=bracket_start
-            )
+_REGEX_ESCAPE = re.compile(r"\\(.)", re.DOTALL)
+"""Finds escaped characters to unescape in a literal regex."""
 
-        # Handle ] as first character in class (literal ])
-        if pattern[i] == "]":
-            result.append("]")
-            i += 1
+_RegexShape: TypeAlias = Literal["literal", "prefix", "suffix", "regex"]
+"""Shapes of regex patterns, from the cheapest check to the regex engine."""
 
-        # Collect characters until closing ]
-        i = self._collect_bracket_contents(pattern, i, n, result)
 
-        if i >= n:
-            raise PatternSyntaxError(
-                pattern, "unclosed bracket", position=bracket_start
-            )
+def _regex_literal(pattern: str) -> str | None:
+    """Return the string a regex matches if it matches exactly one string.
 
-        result.append("]")
-        return i + 1
+    Args:
+        pattern: The regex pattern to inspect.
+
+    Returns:
+        The unescaped literal, or None if the pattern has metacharacters.
+    """
+    if _REGEX_LITERAL.fullmatch(pattern) is None:
+        return None
+    return _REGEX_ESCAPE.sub(r"\1", pattern)
+
+
+def _fused(compiled: "Sequence[re.Pattern[str]]") -> "re.Pattern[str] | None":
+    """Compile regexes into a single alternation.
+
+    Patterns that would change meaning inside an alternation (inline global
+    flags, numbered group references, clashing group names) are not fused.
+
+    Args:
+        compiled: The individually compiled regexes to fuse, in order.
+
+    Returns:
+        A regex that fully matches a path iff any of the regexes does, or
+        None if the regexes cannot be fused.
+    """
+    if len(compiled) == 1:
+        return compiled[0]
+    if any(
+        regex.flags != re.UNICODE or _GROUP_REFERENCE.search(regex.pattern)
+        for regex in compiled
+    ):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{regex.pattern})" for regex in compiled))
+    except re.error:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_regex_set(
+    patterns: "tuple[str | re.Pattern[str], ...]",
+) -> _RegexSet:
+    """Compile regex patterns into a single matcher.
+
+    Every pattern is validated on its own first, so an invalid one is
+    reported by itself. Patterns without metacharacters become a set
+    lookup, and ``LITERAL.*`` and ``.*LITERAL`` become prefix and suffix
+    checks; the rest are fused into one alternation where possible.
+    Pre-compiled patterns are used as given, since their flags may change
+    what the source string matches.
+
+    Args:
+        patterns: The regex patterns to compile, in order, as strings or
+            compiled regexes.
+
+    Returns:
+        A matcher that accepts a path iff any of the patterns does.
+
+    Raises:
+        PatternSyntaxError: For the first pattern that is empty or invalid.
+    """
+    shapes: dict[_RegexShape, list[str]] = {"literal": [], "prefix": [], "suffix": []}
+    regexes: list[re.Pattern[str]] = []
+
+    for pattern in patterns:
+        if isinstance(pattern, re.Pattern):
+            regexes.append(pattern)
+            continue
+        regex = _checked_regex(pattern)
+        shape, literal = _regex_shape(pattern)
+        if shape == "regex":
+            regexes.append(regex)
+        else:
+            shapes[shape].append(literal)
+
+    fused = _fused(regexes) if regexes else None
+    return _RegexSet(
+        literals=frozenset(shapes["literal"]),
+        prefixes=tuple(shapes["prefix"]),
+        suffixes=tuple(shapes["suffix"]),
+        regexes=tuple(regexes) if fused is None else (fused,),
+        cost=_regex_set_cost(shapes, regexes),
+    )
+
+
+def _regex_set_cost(
+    shapes: "dict[_RegexShape, list[str]]", regexes: "list[re.Pattern[str]]"
+) -> int:
+    """Return the rough cost of checking a path against a compiled set.
+
+    Args:
+        shapes: Literals of the string-checked patterns, by shape.
+        regexes: Patterns that need the regex engine.
+
+    Returns:
+        2 if a regex runs, 1 if prefix or suffix checks are needed, and 0
+        for a set lookup only.
+    """
+    if regexes:
+        return 2
+    if shapes["prefix"] or shapes["suffix"]:
+        return 1
+    return 0
 
-    def _collect_bracket_contents(
-        self, pattern: str, i: int, n: int, result: list[str]
-    ) -> int:
-        """Collect contents of a character class until closing ']'."""
-        while i < n and pattern[i] != "]":
-            char = pattern[i]
-            if char == "\\":
-                i = self._handle_bracket_escape(pattern, i, n, result)
-            elif char == "-":
-                result.append("-")
-                i += 1
-            else:
-                self._handle_bracket_char(char, result)
-                i += 1
-        return i
-
-    def _handle_bracket_escape(
-        self, pattern: str, i: int, n: int, result: list[str]
-    ) -> int:
-        """Handle backslash escape inside bracket expression."""
-        result.append("\\")
-        i += 1
-        if i < n:
-            result.append(pattern[i])
-            i += 1
-        return i
 
-    def _handle_bracket_char(self, char: str, result: list[str]) -> None:
-        """Handle a regular character inside bracket expression."""
-        if char in r"\^-]":
-            result.append("\\")
-        result.append(char)
+def _regex_shape(pattern: str) -> tuple[_RegexShape, str]:
+    """Classify a regex by the string comparison that can answer it.
+
+    Args:
+        pattern: A valid regex pattern.
+
+    Returns:
+        The shape of the pattern and the literal it is checked against.
+        Patterns that need the regex engine are ``"regex"`` and returned
+        unchanged.
+    """
+    if (literal := _regex_literal(pattern)) is not None:
+        return "literal", literal
+    if pattern.endswith(".*") and (literal := _regex_literal(pattern[:-2])):
+        return "prefix", literal
+    if pattern.startswith(".*") and (literal := _regex_literal(pattern[2:])):
+        return "suffix", literal
+    return "regex", pattern
 
 
 @final
@@ -406,39 +903,45 @@ class RegexMatcher:
         ```
     """
 
-    __slots__ = ("_cache",)
+    __slots__ = ()
 
-    def __init__(self) -> None:
-        """Initialize the matcher with an empty pattern cache."""
-        self._cache: dict[str, _CompiledPattern] = {}
+    supports_negation: bool = False
+    """Whether this matcher supports negation patterns."""
 
-    @property
-    def supports_negation(self) -> bool:
-        """Whether this matcher supports negation patterns.
+    supports_dir_only: bool = False
+    """Whether this matcher supports directory-only patterns."""
 
-        Returns:
-            Always False for RegexMatcher.
-        """
-        return False
+    @staticmethod
+    def compile_patterns(patterns: "Sequence[str]") -> "list[re.Pattern[str]]":
+        r"""Compile regex patterns once for reuse across many matches() calls.
 
-    @property
-    def supports_dir_only(self) -> bool:
-        """Whether this matcher supports directory-only patterns.
+        Args:
+            patterns: Regex pattern strings to compile.
 
         Returns:
-            Always False for RegexMatcher.
+            The compiled patterns, in order.
+
+        Raises:
+            PatternSyntaxError: If any pattern is empty or has invalid syntax.
+
+        Example:
+            ```python
+            matcher = RegexMatcher()
+            include = matcher.compile_patterns([r".*\.py"])
+            matcher.matches("main.py", include=include)  # True
+            ```
         """
-        return False
+        return [_checked_regex(pattern) for pattern in patterns]
 
     def matches(
         self,
         path: str,
         *,
         is_dir: bool = False,
-        include: "Sequence[str]" = (),
-        exclude: "Sequence[str]" = (),
+        include: "Sequence[str | re.Pattern[str]]" = (),
+        exclude: "Sequence[str | re.Pattern[str]]" = (),
     ) -> bool:
-        """Check if path matches the include/exclude patterns.
+        r"""Check if path matches the include/exclude patterns.
 
         A path matches if:
         - It matches at least one include pattern (or include is empty), AND
@@ -448,69 +951,89 @@ class RegexMatcher:
             path: Relative path from search root (forward slashes).
             is_dir: Whether the path represents a directory (ignored by RegexMatcher).
             include: Patterns the path must match (empty = match all).
+                Compiled patterns are used as given, including their flags.
             exclude: Patterns that reject the path.
 
         Returns:
             True if the path should be included in results.
 
         Raises:
-            PatternSyntaxError: If any pattern has invalid regex syntax.
-        """
-        del is_dir  # Unused by RegexMatcher (no dir_only support)
+            PatternSyntaxError: If any string pattern has invalid regex syntax.
 
-        # Check include patterns (empty = match all)
-        if include:
-            included = any(self._match_pattern(path, p) for p in include)
-            if not included:
-                return False
+        Example:
+            ```python
+            import re
 
-        # Check exclude patterns
-        if exclude:
-            excluded = any(self._match_pattern(path, p) for p in exclude)
-            if excluded:
-                return False
+            matcher = RegexMatcher()
+            matcher.matches("README.MD", include=[re.compile(r".*\.md", re.I)])  # True
+            ```
+        """
+        del is_dir  # Unused by RegexMatcher (no dir_only support)
 
-        return True
+        included = _compile_regex_set(tuple(include)) if include else None
+        excluded = _compile_regex_set(tuple(exclude)) if exclude else None
 
-    def _match_pattern(self, path: str, pattern: str) -> bool:
-        """Test if a path matches a single pattern.
+        if excluded is None:
+            # Check include patterns (empty = match all)
+            return included is None or included.fullmatch(path)
+        if included is None:
+            return not excluded.fullmatch(path)
 
-        Args:
-            path: Relative path from search root.
-            pattern: Regex pattern to match against.
+        # Run the cheaper list first so it can reject the path early
+        if excluded.cost < included.cost:
+            return not excluded.fullmatch(path) and included.fullmatch(path)
+        return included.fullmatch(path) and not excluded.fullmatch(path)
 
-        Returns:
-            True if the path matches the pattern.
-        """
-        compiled = self._compile(pattern)
-        return compiled.regex.fullmatch(path) is not None
+    def matches_many(
+        self,
+        paths: "Sequence[str]",
+        *,
+        is_dir: bool = False,
+        include: "Sequence[str | re.Pattern[str]]" = (),
+        exclude: "Sequence[str | re.Pattern[str]]" = (),
+    ) -> list[bool]:
+        r"""Check a batch of paths against the same include/exclude patterns.
 
-    def _compile(self, pattern: str) -> _CompiledPattern:
-        """Compile a regex pattern (with caching).
+        Equivalent to calling matches() for each path, but the pattern lists
+        are looked up once per batch instead of once per path.
 
         Args:
-            pattern: The regex pattern string to compile.
+            paths: Relative paths from search root (forward slashes).
+            is_dir: Whether the paths represent directories (ignored by
+                RegexMatcher).
+            include: Patterns a path must match (empty = match all).
+            exclude: Patterns that reject a path.
 
         Returns:
-            A compiled pattern ready for matching.
+            One flag per path, True if that path should be included.
 
         Raises:
-            PatternSyntaxError: If the pattern is empty or has invalid syntax.
+            PatternSyntaxError: If any string pattern has invalid regex syntax.
+
+        Example:
+            ```python
+            matcher = RegexMatcher()
+            matcher.matches_many(["a.py", "b.md"], include=[r".*\.py"])  # [True, False]
+            ```
         """
-        if pattern in self._cache:
-            return self._cache[pattern]
+        del is_dir  # Unused by RegexMatcher (no dir_only support)
 
-        if not pattern:
-            raise PatternSyntaxError(pattern, "empty pattern")
+        included = _compile_regex_set(tuple(include)) if include else None
+        excluded = _compile_regex_set(tuple(exclude)) if exclude else None
 
-        try:
-            regex = re.compile(pattern)
-        except re.error as e:
-            raise PatternSyntaxError(pattern, str(e)) from e
+        results = [True] * len(paths)
+
+        if included is not None:
+            results = [included.fullmatch(path) for path in paths]
 
-        compiled = _CompiledPattern(regex=regex, pattern=pattern)
-        self._cache[pattern] = compiled
-        return compiled
+        if excluded is not None:
+            excluded_match = excluded.fullmatch
+            results = [
+                ok and not excluded_match(path)
+                for ok, path in zip(results, paths, strict=True)
+            ]
+
+        return results
 
 
 @final
@@ -530,6 +1053,12 @@ class GitignoreMatcher:
 
         pip install searchpath[gitignore]
 
+    Patterns are evaluated by one of pathspec's regex backends. By default
+    pathspec picks the best installed backend: ``re2`` or ``hyperscan`` match
+    all patterns of a spec in a single compiled pass and are used when
+    ``pathspec[re2]`` or ``pathspec[hyperscan]`` is installed, otherwise the
+    pure-Python ``simple`` backend is used.
+
     Example:
         ```python
         matcher = GitignoreMatcher()
@@ -538,10 +1067,26 @@ class GitignoreMatcher:
         ```
     """
 
-    __slots__ = ("_spec_cache",)
+    __slots__ = ("_backend", "_spec_cache")
+
+    supports_negation: bool = True
+    """Whether this matcher supports negation patterns."""
+
+    supports_dir_only: bool = True
+    """Whether this matcher supports directory-only patterns."""
 
-    def __init__(self) -> None:
-        """Initialize the matcher, checking for pathspec availability."""
+    def __init__(self, *, backend: "GitignoreBackend" = "best") -> None:
+        """Initialize the matcher, checking for pathspec availability.
+
+        Args:
+            backend: The pathspec matching backend: "best" (the default)
+                selects the fastest installed backend; "re2", "hyperscan",
+                or "simple" force a specific one.
+
+        Raises:
+            ImportError: If pathspec or the requested backend is not installed.
+            ValueError: If backend is not a known backend name.
+        """
         try:
             import pathspec  # noqa: F401, PLC0415  # pyright: ignore[reportUnusedImport]
         except ImportError as e:  # pragma: no cover
@@ -550,25 +1095,20 @@ class GitignoreMatcher:
                 "Install it with: pip install searchpath[gitignore]"
             )
             raise ImportError(msg) from e
-        self._spec_cache: dict[tuple[str, ...], GitIgnoreSpec] = {}
-
-    @property
-    def supports_negation(self) -> bool:
-        """Whether this matcher supports negation patterns.
 
-        Returns:
-            Always True for GitignoreMatcher.
-        """
-        return True
+        from pathspec import GitIgnoreSpec  # noqa: PLC0415
 
-    @property
-    def supports_dir_only(self) -> bool:
-        """Whether this matcher supports directory-only patterns.
+        try:
+            _ = GitIgnoreSpec.from_lines((), backend=backend)
+        except ImportError as e:
+            msg = (
+                f"GitignoreMatcher backend {backend!r} is not available. "
+                f"Install it with: pip install pathspec[{backend}]"
+            )
+            raise ImportError(msg) from e
 
-        Returns:
-            Always True for GitignoreMatcher.
-        """
-        return True
+        self._backend: GitignoreBackend = backend
+        self._spec_cache: dict[tuple[str, ...], GitIgnoreSpec] = {}
 
     def matches(
         self,
@@ -653,7 +1193,7 @@ class GitignoreMatcher:
         from pathspec import GitIgnoreSpec  # noqa: PLC0415
 
         try:
-            spec = GitIgnoreSpec.from_lines(patterns)
+            spec = GitIgnoreSpec.from_lines(patterns, backend=self._backend)
         except Exception as e:
             raise PatternSyntaxError(str(patterns), str(e)) from e
 
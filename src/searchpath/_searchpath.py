@@ -1,15 +1,18 @@
 """SearchPath class for ordered directory searching."""
 
+import itertools
+import os
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, TypeAlias, final
 
 from searchpath._ancestor_patterns import (
+    EMPTY_ANCESTOR_PATTERNS,
     AncestorPatterns,
     collect_ancestor_patterns,
     merge_patterns,
 )
-from searchpath._match import Match
+from searchpath._match import Match, relative_path_str
 from searchpath._matchers import GlobMatcher
 from searchpath._traversal import TraversalKind, load_patterns, traverse
 
@@ -27,6 +30,28 @@ if TYPE_CHECKING:
 Entry: TypeAlias = "tuple[str, Path | str | None] | Path | str | None"
 """Type alias for SearchPath entry arguments."""
 
+_PATH_TYPE = type(Path())
+"""The concrete Path class for this platform (PosixPath or WindowsPath)."""
+
+_DIR_NAMES = tuple(sys.intern(f"dir{i}") for i in range(256))
+"""Interned auto-generated scope names for the first bare entries."""
+
+
+def _auto_name(index: int) -> str:
+    """Return the interned auto-generated scope name for a bare entry."""
+    if index < len(_DIR_NAMES):
+        return _DIR_NAMES[index]
+    return sys.intern(f"dir{index}")
+
+
+def _exists(path: str) -> bool:
+    """Check whether a path exists, like os.path.exists() without the wrapper."""
+    try:
+        _ = os.stat(path)  # noqa: PTH116
+    except (OSError, ValueError):
+        return False
+    return True
+
 
 @final
 class SearchPath:
@@ -58,7 +83,7 @@ class SearchPath:
         ```
     """
 
-    __slots__ = ("_entries",)
+    __slots__ = ("_dirs", "_repr", "_scopes", "_str")
 
     def __init__(
         self,
@@ -73,14 +98,19 @@ class SearchPath:
                 - A bare Path or str: Auto-named as "dir0", "dir1", etc.
                 - None: Silently ignored
         """
-        bare_paths = [e for e in entries if e is not None and not isinstance(e, tuple)]
-        auto_names = {id(p): f"dir{i}" for i, p in enumerate(bare_paths)}
+        auto_index = itertools.count()
 
-        self._entries: list[tuple[str, Path]] = []
+        scopes: list[str] = []
+        self._dirs: list[Path | str] = []
+        self._repr: str | None = None
+        self._str: str | None = None
         for entry in entries:
-            parsed = self._parse_entry(entry, auto_names)
+            parsed = self._parse_entry(entry, auto_index)
             if parsed is not None:
-                self._entries.append(parsed)
+                scopes.append(parsed[0])
+                self._dirs.append(parsed[1])
+        # Scopes never change, so derived search paths can share the tuple
+        self._scopes: tuple[str, ...] = tuple(scopes)
 
     def __add__(self, other: object) -> "Self":
         """Concatenate two search paths.
@@ -107,12 +137,19 @@ class SearchPath:
         """
         if not isinstance(other, SearchPath):
             return NotImplemented  # type: ignore[return-value]
-        new_entries = self._entries + other._entries
-        return self._from_entries(new_entries)
+        # Search paths never change, so an empty side needs no copy
+        if not other._dirs:
+            return self
+        if not self._dirs:
+            return other  # pyright: ignore[reportReturnType]
+        return self._from_parallel(
+            self._scopes + other._scopes,
+            self._dirs + other._dirs,
+        )
 
     def __bool__(self) -> bool:
         """Return True if the search path has any directories."""
-        return len(self._entries) > 0
+        return bool(self._dirs)
 
     def __iter__(self) -> "Iterator[Path]":
         """Iterate over directories in the search path.
@@ -120,67 +157,90 @@ class SearchPath:
         Yields:
             Each directory Path in order.
         """
-        for _, path in self._entries:
-            yield path
+        dirs = self._dirs
+        for index, entry in enumerate(dirs):
+            if isinstance(entry, str):
+                # Convert lazily and keep the Path for later iterations
+                converted = dirs[index] = Path(entry)
+                yield converted
+            else:
+                yield entry
 
     def __len__(self) -> int:
         """Return the number of directories in the search path."""
-        return len(self._entries)
+        return len(self._dirs)
 
     @override
     def __repr__(self) -> str:
         """Return a detailed string representation.
 
+        The result is computed once; SearchPath entries never change.
+
         Returns:
             A string showing the SearchPath constructor call.
         """
-        if not self._entries:
-            return "SearchPath()"
-        entries_repr = ", ".join(
-            f"({scope!r}, {path!r})" for scope, path in self._entries
-        )
-        return f"SearchPath({entries_repr})"
+        if self._repr is None:
+            entries_repr = ", ".join(
+                f"({scope!r}, {path!r})" for scope, path in self.items()
+            )
+            self._repr = f"SearchPath({entries_repr})"
+        return self._repr
 
     @override
     def __str__(self) -> str:
         """Return a human-readable string representation.
 
-        Format suitable for error messages showing scope: path pairs.
+        Format suitable for error messages showing scope: path pairs. The
+        result is computed once; SearchPath entries never change.
 
         Returns:
             A string like "project: /project/.config, user: ~/.config"
         """
-        if not self._entries:
-            return "(empty)"
-        return ", ".join(f"{scope}: {path}" for scope, path in self._entries)
+        if self._str is None:
+            self._str = (
+                ", ".join(f"{scope}: {path}" for scope, path in self.items())
+                or "(empty)"
+            )
+        return self._str
 
     @classmethod
-    def _from_entries(cls, entries: list[tuple[str, Path]]) -> "Self":
-        """Create a SearchPath from a pre-built entry list.
+    def _from_parallel(
+        cls, scopes: tuple[str, ...], dirs: "list[Path | str]"
+    ) -> "Self":
+        """Create a SearchPath from pre-built scope and directory lists.
 
         This is an internal constructor used by methods that need to
         create SearchPath instances without re-parsing entries.
 
         Args:
-            entries: List of (scope, path) tuples.
+            scopes: Scope names, one per directory. The tuple may be shared
+                with other instances.
+            dirs: Directories in order, owned by the new instance. String
+                paths are converted to Path in place when first read.
 
         Returns:
             A new SearchPath instance.
         """
         instance = cls.__new__(cls)
-        instance._entries = entries  # noqa: SLF001
+        instance._scopes = scopes  # noqa: SLF001
+        instance._dirs = dirs  # noqa: SLF001
+        instance._repr = None  # noqa: SLF001
+        instance._str = None  # noqa: SLF001
         return instance
 
     @staticmethod
     def _parse_entry(
         entry: tuple[str, Path | str | None] | Path | str | None,
-        auto_names: dict[int, str],
-    ) -> tuple[str, Path] | None:
+        auto_index: "Iterator[int]",
+    ) -> tuple[str, Path | str] | None:
         """Parse a single entry into (scope, path) or None.
 
+        String paths are kept as given; iteration converts them on first use.
+
         Args:
             entry: The entry to parse.
-            auto_names: Mapping from bare path id to auto-generated scope name.
+            auto_index: Counter for auto-generated scope names, advanced
+                only for bare paths.
 
         Returns:
             A tuple of (scope, path) or None if entry should be skipped.
@@ -192,11 +252,10 @@ class SearchPath:
             scope, path = entry
             if path is None:
                 return None
-            resolved_path = Path(path) if isinstance(path, str) else path
-            return (scope, resolved_path)
+            # Intern scope names so repeated scopes share one string
+            return (sys.intern(scope) if type(scope) is str else scope, path)
 
-        resolved_path = Path(entry) if isinstance(entry, str) else entry
-        return (auto_names[id(entry)], resolved_path)
+        return (_auto_name(next(auto_index)), entry)
 
     @property
     def dirs(self) -> list[Path]:
@@ -205,7 +264,7 @@ class SearchPath:
         Returns:
             A list of directory Paths in order.
         """
-        return [path for _, path in self._entries]
+        return list(self)
 
     @property
     def scopes(self) -> list[str]:
@@ -214,7 +273,7 @@ class SearchPath:
         Returns:
             A list of scope name strings in order.
         """
-        return [scope for scope, _ in self._entries]
+        return list(self._scopes)
 
     def with_suffix(self, *parts: str) -> "Self":
         """Create a new SearchPath with path components appended.
@@ -235,8 +294,22 @@ class SearchPath:
             list(sp2)  # [PosixPath('/home/user/.config/myapp')]
             ```
         """
-        new_entries = [(scope, path.joinpath(*parts)) for scope, path in self._entries]
-        return self._from_entries(new_entries)
+        if not parts:
+            return self._from_parallel(self._scopes, self._dirs[:])
+
+        # Build the suffix once and store normalized Paths, so an entry
+        # such as "file/" never reaches existing(). Other PurePath types
+        # join the parts themselves to keep their type.
+        suffix = Path(*parts)
+        dirs: list[Path | str] = []
+        for path in self._dirs:
+            if isinstance(path, str):
+                dirs.append(Path(path, suffix))
+            elif type(path) is _PATH_TYPE:
+                dirs.append(path / suffix)
+            else:
+                dirs.append(path.joinpath(*parts))
+        return self._from_parallel(self._scopes, dirs)
 
     def filter(self, predicate: "Callable[[Path], bool]") -> "Self":
         """Create a new SearchPath with entries filtered by a predicate.
@@ -255,18 +328,42 @@ class SearchPath:
             filtered = sp.filter(lambda p: p.exists())
             ```
         """
-        new_entries = [
-            (scope, path) for scope, path in self._entries if predicate(path)
-        ]
-        return self._from_entries(new_entries)
+        # Iterating self converts string entries, so _dirs holds Paths after
+        mask = list(map(predicate, self))
+        return self._from_parallel(
+            tuple(itertools.compress(self._scopes, mask)),
+            list(itertools.compress(self._dirs, mask)),
+        )
 
-    def existing(self) -> "Self":
+    def existing(
+        self,
+        predicate: "Callable[[Path], bool] | None" = None,
+        *,
+        max_workers: int | None = None,
+    ) -> "Self":
         """Create a new SearchPath with only existing directories.
 
-        This is a shorthand for `filter(lambda p: p.exists())`.
+        Without a predicate this is equivalent to
+        `filter(lambda p: p.exists())`, but checks each entry with os.stat()
+        directly and checks repeated entries only once. Results are not
+        kept between calls.
+
+        Args:
+            predicate: Optional function that takes a Path and returns True
+                to keep the entry. It runs before the existence check, so
+                entries it rejects are never looked up on disk.
+                `sp.existing(pred)` keeps the same entries as
+                `sp.existing().filter(pred)`.
+            max_workers: Check entries concurrently on up to this many
+                threads. Useful on network filesystems where each check
+                can block; by default entries are checked one at a time.
 
         Returns:
-            A new SearchPath containing only directories that exist.
+            A new SearchPath containing only directories that exist (and
+            satisfy the predicate, if given).
+
+        Raises:
+            ValueError: If max_workers is less than 1.
 
         Example:
             ```python
@@ -280,15 +377,49 @@ class SearchPath:
                 )
                 existing_sp = sp.existing()
                 len(existing_sp)  # 1
+                len(sp.existing(lambda p: p.name != "dir"))  # 1
+                len(sp.existing(max_workers=4))  # 1
             ```
         """
-        return self.filter(lambda p: p.exists())
+        if max_workers is not None and max_workers < 1:
+            msg = "max_workers must be at least 1"
+            raise ValueError(msg)
+
+        # Check the normalized Path form, as Path.exists() would: a raw
+        # string such as "" or "file/" does not stat the same way
+        paths = list(self)
+        scopes: tuple[str, ...] | list[str]
+        dirs: list[Path]
+        if predicate is None:
+            scopes, dirs = self._scopes, paths
+        else:
+            mask = list(map(predicate, paths))
+            scopes = list(itertools.compress(self._scopes, mask))
+            dirs = list(itertools.compress(paths, mask))
+
+        # Entries repeated in this search path are checked once per call
+        keys = [os.fspath(path) for path in dirs]
+        unique = list(dict.fromkeys(keys))
+        if max_workers is None or len(unique) <= 1:
+            found = list(map(_exists, unique))
+        else:
+            # os.stat() releases the GIL, so slow lookups overlap
+            from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                found = list(executor.map(_exists, unique))
+        exists = dict(zip(unique, found, strict=True))
+        mask = [exists[key] for key in keys]
+        return self._from_parallel(
+            tuple(itertools.compress(scopes, mask)),
+            list(itertools.compress(dirs, mask)),
+        )
 
     def items(self) -> "Iterator[tuple[str, Path]]":
         """Iterate over (scope, path) pairs in the search path.
 
-        Yields:
-            Tuples of (scope_name, directory_path) in order.
+        Returns:
+            An iterator of (scope_name, directory_path) tuples in order.
 
         Example:
             ```python
@@ -297,7 +428,7 @@ class SearchPath:
             # [('user', PosixPath('/user')), ('system', PosixPath('/sys'))]
             ```
         """
-        yield from self._entries
+        return zip(self._scopes, self, strict=True)
 
     @staticmethod
     def _normalize_pattern_arg(
@@ -323,6 +454,8 @@ class SearchPath:
     ) -> "Sequence[Path]":
         """Normalize path argument to a sequence of Paths.
 
+        Path objects are reused rather than copied.
+
         Args:
             paths: A single path, sequence of paths, or None.
 
@@ -331,9 +464,8 @@ class SearchPath:
         """
         if paths is None:
             return ()
-        if isinstance(paths, (str, Path)):
-            return (Path(paths),)
-        return tuple(Path(p) for p in paths)
+        items = (paths,) if isinstance(paths, (str, Path)) else paths
+        return tuple(p if isinstance(p, Path) else Path(p) for p in items)
 
     @staticmethod
     def _load_pattern_files(paths: "Sequence[Path]") -> list[str]:
@@ -398,7 +530,11 @@ class SearchPath:
         """
         seen: set[str] = set()
         for match in matches:
-            key = match.relative.as_posix()
+            # Key on the relative path string; only build a Path when the
+            # match does not lie textually under its source
+            key = relative_path_str(os.fspath(match.path), os.fspath(match.source))
+            if key is None:
+                key = os.fspath(match.relative)
             if key not in seen:
                 seen.add(key)
                 yield match
@@ -416,15 +552,17 @@ class SearchPath:
 
         Returns True if the path passes the merged ancestor + inline patterns.
         """
-        rel_path = path.relative_to(source_resolved).as_posix()
-        is_dir = path.is_dir()
-
-        merged_include = merge_patterns(ancestors.include, include)
-        merged_exclude = merge_patterns(ancestors.exclude, exclude)
+        if ancestors is EMPTY_ANCESTOR_PATTERNS:
+            merged_include, merged_exclude = include, exclude
+        else:
+            merged_include = merge_patterns(ancestors.include, include)
+            merged_exclude = merge_patterns(ancestors.exclude, exclude)
 
         if not merged_include and not merged_exclude:
             return True
 
+        rel_path = path.relative_to(source_resolved).as_posix()
+        is_dir = path.is_dir()
         return matcher.matches(
             rel_path, is_dir=is_dir, include=merged_include, exclude=merged_exclude
         )
@@ -495,7 +633,7 @@ class SearchPath:
         follow_symlinks: bool,
     ) -> "Iterator[Match]":
         """Iterate matches without ancestor pattern handling."""
-        for scope, source in self._entries:
+        for scope, source in self.items():
             for path in traverse(
                 source,
                 pattern=pattern,
@@ -524,7 +662,7 @@ class SearchPath:
         resolved_matcher = matcher if matcher is not None else GlobMatcher()
         traverse_include = () if include_from_ancestors is not None else include
 
-        for scope, source in self._entries:
+        for scope, source in self.items():
             source_resolved = source.resolve()
             for path in traverse(
                 source,
@@ -1,12 +1,16 @@
 """Directory traversal with pattern filtering."""
 
+import errno
+import functools
 import os
+import stat
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
 from searchpath._exceptions import PatternFileError
-from searchpath._matchers import GlobMatcher
+from searchpath._matchers import BatchPathMatcher, GlobMatcher
 
 if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
@@ -15,6 +19,8 @@ if TYPE_CHECKING:
 
 TraversalKind = Literal["files", "dirs", "both"]
 
+_READ_CHUNK_SIZE = 4096
+
 
 def load_patterns(path: Path | str) -> list[str]:
     """Load patterns from a file, one pattern per line.
@@ -23,6 +29,9 @@ def load_patterns(path: Path | str) -> list[str]:
     treated as comments and ignored. Empty lines and whitespace-only lines
     are also ignored. Whitespace is stripped from each pattern.
 
+    Parsed files are cached by path, modification time and size, so
+    loading an unchanged file again does not re-read it.
+
     Args:
         path: Path to the pattern file.
 
@@ -45,7 +54,8 @@ def load_patterns(path: Path | str) -> list[str]:
     path = Path(path)
 
     try:
-        content = path.read_text(encoding="utf-8")
+        st = path.stat()
+        patterns = _read_patterns(str(path), st.st_mtime_ns, st.st_size)
     except FileNotFoundError as e:
         raise PatternFileError(path, "file not found") from e
     except PermissionError as e:
@@ -55,13 +65,43 @@ def load_patterns(path: Path | str) -> list[str]:
     except UnicodeDecodeError as e:
         raise PatternFileError(path, f"invalid encoding: {e}") from e
 
-    patterns: list[str] = []
-    for line in content.splitlines():
-        stripped = line.strip()
-        if stripped and not stripped.startswith("#"):
-            patterns.append(stripped)
+    return list(patterns)
+
+
+@functools.lru_cache(maxsize=256)
+def _read_patterns(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Read and parse a pattern file (cached).
+
+    Args:
+        path: Path to the pattern file.
+        mtime_ns: Modification time of the file, part of the cache key.
+        size: Size of the file in bytes, part of the cache key and the
+            expected read size.
+
+    Returns:
+        Patterns from the file.
+    """
+    del mtime_ns  # Only used to invalidate the cache
 
-    return patterns
+    # Pattern files are small; read the raw bytes without the buffered
+    # text I/O stack and decode them once
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if stat.S_ISDIR(os.fstat(fd).st_mode):
+            raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), path)
+        chunks: list[bytes] = []
+        while chunk := os.read(fd, max(size, _READ_CHUNK_SIZE)):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+    content = b"".join(chunks).decode("utf-8")
+    # Interned patterns compare by identity in the matcher compile caches
+    return tuple(
+        sys.intern(stripped)
+        for line in content.splitlines()
+        if (stripped := line.strip()) and not stripped.startswith("#")
+    )
 
 
 @dataclass(frozen=True, slots=True)
@@ -73,6 +113,7 @@ class _TraversalContext:
     include: "Sequence[str]"
     exclude: "Sequence[str]"
     matcher: "PathMatcher"
+    batch_matcher: "BatchPathMatcher | None"
 
 
 def traverse(  # noqa: PLR0913
@@ -127,6 +168,9 @@ def traverse(  # noqa: PLR0913
         include=effective_include,
         exclude=exclude,
         matcher=resolved_matcher,
+        batch_matcher=(
+            resolved_matcher if isinstance(resolved_matcher, BatchPathMatcher) else None
+        ),
     )
 
     yield from _walk_tree(ctx, follow_symlinks=follow_symlinks)
@@ -171,16 +215,9 @@ def _prune_excluded_dirs(
     if not ctx.exclude:
         return
 
-    dirnames[:] = [
-        dirname
-        for dirname in dirnames
-        if ctx.matcher.matches(
-            f"{current_rel}/{dirname}" if current_rel else dirname,
-            is_dir=True,
-            include=(),
-            exclude=ctx.exclude,
-        )
-    ]
+    rel_paths = [f"{current_rel}/{name}" if current_rel else name for name in dirnames]
+    keep = _match_paths(ctx, rel_paths, is_dir=True, include=())
+    dirnames[:] = [name for name, kept in zip(dirnames, keep, strict=True) if kept]
 
 
 def _yield_matching_entries(
@@ -192,10 +229,34 @@ def _yield_matching_entries(
     is_dir: bool,
 ) -> "Iterator[Path]":
     """Yield entries that match the include/exclude patterns."""
-    for name in names:
-        rel_path = f"{current_rel}/{name}" if current_rel else name
+    rel_paths = [f"{current_rel}/{name}" if current_rel else name for name in names]
+    matched = _match_paths(ctx, rel_paths, is_dir=is_dir, include=ctx.include)
 
-        if ctx.matcher.matches(
-            rel_path, is_dir=is_dir, include=ctx.include, exclude=ctx.exclude
-        ):
+    for name, ok in zip(names, matched, strict=True):
+        if ok:
             yield current_dir / name
+
+
+def _match_paths(
+    ctx: _TraversalContext,
+    rel_paths: list[str],
+    *,
+    is_dir: bool,
+    include: "Sequence[str]",
+) -> "Sequence[bool]":
+    """Match one directory's worth of paths against the context's patterns.
+
+    Uses the matcher's matches_many() batch method when it implements
+    BatchPathMatcher and falls back to calling matches() per path for other
+    PathMatcher implementations.
+    """
+    if ctx.batch_matcher is not None:
+        return ctx.batch_matcher.matches_many(
+            rel_paths, is_dir=is_dir, include=include, exclude=ctx.exclude
+        )
+    return [
+        ctx.matcher.matches(
+            rel_path, is_dir=is_dir, include=include, exclude=ctx.exclude
+        )
+        for rel_path in rel_paths
+    ]
@@ -3,12 +3,16 @@ from typing import TYPE_CHECKING, Literal
 
 import pytest
 
-from searchpath import GlobMatcher
+from searchpath import BatchPathMatcher, GlobMatcher
 from searchpath._traversal import traverse
 
 from tests.conftest import Symlink
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pytest_mock import MockerFixture
+
     from tests.conftest import TreeFactory
 
 
@@ -381,6 +385,44 @@ class TestTraverseWithMatcher:
 
         assert result == [root / "file.py"]
 
+    def test_batch_matcher_checks_each_directory_in_one_call(
+        self, tmp_tree: "TreeFactory", mocker: "MockerFixture"
+    ):
+        root = tmp_tree({"a.py": "", "b.txt": "", "src": {"c.py": ""}})
+        directories = [root, root / "src"]
+        matcher = GlobMatcher()
+        spy = mocker.spy(GlobMatcher, "matches_many")
+
+        result = sorted(traverse(root, pattern="**/*.py", matcher=matcher))
+
+        assert isinstance(matcher, BatchPathMatcher)
+        assert result == [root / "a.py", root / "src" / "c.py"]
+        assert spy.call_count == len(directories)
+
+    def test_matcher_without_batch_method_falls_back(self, tmp_tree: "TreeFactory"):
+        class SuffixMatcher:
+            supports_negation: bool = False
+            supports_dir_only: bool = False
+
+            def matches(
+                self,
+                path: str,
+                *,
+                is_dir: bool = False,
+                include: "Sequence[str]" = (),
+                exclude: "Sequence[str]" = (),
+            ) -> bool:
+                del is_dir, exclude
+                return any(path.endswith(suffix) for suffix in include)
+
+        root = tmp_tree({"a.py": "", "b.txt": ""})
+        matcher = SuffixMatcher()
+
+        result = list(traverse(root, pattern=".py", matcher=matcher))
+
+        assert not isinstance(matcher, BatchPathMatcher)
+        assert result == [root / "a.py"]
+
     def test_default_matcher_is_glob(self, tmp_tree: "TreeFactory"):
         root = tmp_tree(
             {
@@ -1,8 +1,10 @@
+import os
 from typing import TYPE_CHECKING
 
 import pytest
 
 from searchpath._ancestor_patterns import (
+    EMPTY_ANCESTOR_PATTERNS,
     AncestorPatterns,
     collect_ancestor_patterns,
     merge_patterns,
@@ -74,6 +76,23 @@ class TestCollectAncestorDirs:
 
         assert result == AncestorPatterns(include=(), exclude=())
 
+    def test_sibling_sharing_name_prefix_returns_empty(self, fake_tree: "TreeFactory"):
+        root = fake_tree(
+            {
+                "project": {".include": "*.py\n"},
+                "project-other": {"file.py": ""},
+            }
+        )
+
+        result = collect_ancestor_patterns(
+            root / "project-other" / "file.py",
+            root / "project",
+            include_filename=".include",
+            exclude_filename=None,
+        )
+
+        assert result == AncestorPatterns(include=(), exclude=())
+
 
 class TestCollectAncestorPatterns:
     def test_no_filenames_returns_empty(self, fake_tree: "TreeFactory"):
@@ -88,6 +107,30 @@ class TestCollectAncestorPatterns:
 
         assert result == AncestorPatterns(include=(), exclude=())
 
+    @pytest.mark.parametrize(
+        ("include_filename", "exclude_filename"),
+        [
+            pytest.param(None, None, id="no-filenames"),
+            pytest.param(".include", ".exclude", id="no-pattern-files"),
+        ],
+    )
+    def test_nothing_collected_returns_shared_empty(
+        self,
+        fake_tree: "TreeFactory",
+        include_filename: str | None,
+        exclude_filename: str | None,
+    ):
+        root = fake_tree({"src": {"file.py": ""}})
+
+        result = collect_ancestor_patterns(
+            root / "src" / "file.py",
+            root,
+            include_filename=include_filename,
+            exclude_filename=exclude_filename,
+        )
+
+        assert result is EMPTY_ANCESTOR_PATTERNS
+
     def test_loads_include_from_root(self, fake_tree: "TreeFactory"):
         root = fake_tree(
             {
@@ -207,6 +250,26 @@ class TestCollectAncestorPatterns:
 
         assert result.exclude == ("*.tmp",)
 
+    @pytest.mark.skipif(os.name == "nt", reason="Permission model differs on Windows")
+    def test_loads_from_directory_without_read_permission(
+        self, tmp_tree: "TreeFactory"
+    ):
+        root = tmp_tree({"src": {".exclude": "*.tmp\n", "file.py": ""}})
+        src = root / "src"
+
+        src.chmod(0o311)  # Search but no listing
+        try:
+            result = collect_ancestor_patterns(
+                src / "file.py",
+                root,
+                include_filename=None,
+                exclude_filename=".exclude",
+            )
+        finally:
+            src.chmod(0o755)
+
+        assert result.exclude == ("*.tmp",)
+
     def test_uses_cache_for_repeated_calls(self, fake_tree: "TreeFactory"):
         root = fake_tree(
             {
@@ -240,6 +303,56 @@ class TestCollectAncestorPatterns:
 
         assert result.include == ("modified",)
 
+    def test_caches_missing_pattern_files(self, fake_tree: "TreeFactory"):
+        root = fake_tree(
+            {
+                ".include": "*.py\n",
+                "src": {"file.py": ""},
+            }
+        )
+        cache: dict[Path, list[str]] = {}
+
+        result = collect_ancestor_patterns(
+            root / "src" / "file.py",
+            root,
+            include_filename=".include",
+            exclude_filename=".exclude",
+            cache=cache,
+        )
+
+        assert result.include == ("*.py",)
+        assert result.exclude == ()
+        assert cache == {
+            root / ".include": ["*.py"],
+            root / ".exclude": [],
+            root / "src" / ".include": [],
+            root / "src" / ".exclude": [],
+        }
+
+    def test_siblings_share_pattern_tuples(self, fake_tree: "TreeFactory"):
+        root = fake_tree(
+            {
+                ".include": "*.py\n",
+                "src": {"a.py": "", "b.py": ""},
+            }
+        )
+
+        first = collect_ancestor_patterns(
+            root / "src" / "a.py",
+            root,
+            include_filename=".include",
+            exclude_filename=None,
+        )
+        second = collect_ancestor_patterns(
+            root / "src" / "b.py",
+            root,
+            include_filename=".include",
+            exclude_filename=None,
+        )
+
+        assert first.include == ("*.py",)
+        assert first.include is second.include
+
     def test_strips_whitespace_and_ignores_comments(self, fake_tree: "TreeFactory"):
         content = """# comment
 *.py
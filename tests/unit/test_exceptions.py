@@ -51,6 +51,11 @@ class TestPatternSyntaxError:
         assert exc.message == "test error"
         assert exc.position == position
 
+    def test_args_hold_formatted_message(self):
+        exc = PatternSyntaxError("[abc", "unclosed bracket", position=0)
+
+        assert exc.args == (str(exc),)
+
 
 class TestPatternFileError:
     @pytest.mark.parametrize(
@@ -1,3 +1,5 @@
+import importlib.util
+
 import pytest
 
 from searchpath import GitignoreMatcher, PatternSyntaxError
@@ -216,3 +218,22 @@ class TestGitignoreMatcherProperties:
         matcher = GitignoreMatcher()
 
         assert matcher.supports_dir_only is True
+
+
+class TestGitignoreMatcherBackend:
+    def test_simple_backend_matches(self):
+        matcher = GitignoreMatcher(backend="simple")
+
+        assert matcher.matches("src/main.py", include=["*.py"])
+        assert not matcher.matches("src/main.py", exclude=["src/"])
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("re2") is not None, reason="re2 is installed"
+    )
+    def test_missing_backend_raises_import_error(self):
+        with pytest.raises(ImportError, match=r"pathspec\[re2\]"):
+            _ = GitignoreMatcher(backend="re2")
+
+    def test_unknown_backend_raises_value_error(self):
+        with pytest.raises(ValueError, match="bogus"):
+            _ = GitignoreMatcher(backend="bogus")  # pyright: ignore[reportArgumentType]
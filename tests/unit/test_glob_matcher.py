@@ -1,7 +1,13 @@
+import re
+from typing import TYPE_CHECKING
+
 import pytest
 
 from searchpath import GlobMatcher, PatternSyntaxError
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 class TestGlobMatchingBasic:
     def test_exact_match(self):
@@ -297,6 +303,76 @@ class TestGlobMatcherErrors:
         assert exc_info.value.position == 0
         assert "unclosed bracket" in exc_info.value.message
 
+    def test_repeated_invalid_pattern_raises_fresh_error(self):
+        matcher = GlobMatcher()
+
+        with pytest.raises(PatternSyntaxError) as first:
+            _ = matcher.matches("a.py", include=["[abc"])
+        with pytest.raises(PatternSyntaxError) as second:
+            _ = matcher.matches("b.py", include=["[abc"])
+
+        assert first.value is not second.value
+        assert second.value.position == 0
+
+    def test_invalid_pattern_raises_even_if_earlier_pattern_matches(self):
+        matcher = GlobMatcher()
+
+        with pytest.raises(PatternSyntaxError) as exc_info:
+            _ = matcher.matches("main.py", include=["*.py", "[abc"])
+
+        assert exc_info.value.pattern == "[abc"
+
+
+class TestGlobMatcherCache:
+    def test_compiled_patterns_shared_across_instances(self, mocker: "MockerFixture"):
+        _ = GlobMatcher().matches("main.py", include=["*.shared-cache"])
+        spy = mocker.spy(re, "compile")
+
+        assert GlobMatcher().matches("x.shared-cache", include=["*.shared-cache"])
+        assert spy.call_count == 0
+
+    def test_multiple_patterns_match_as_one_set(self):
+        matcher = GlobMatcher()
+        include = ["*.py", "test_*"]
+
+        assert matcher.matches("main.py", include=include)
+        assert matcher.matches("test_main.txt", include=include)
+        assert not matcher.matches("main.txt", include=include)
+
+    @pytest.mark.parametrize(
+        ("patterns", "path", "expected"),
+        [
+            pytest.param(("config.toml", "src/main.py"), "src/main.py", True, id="hit"),
+            pytest.param(("config.toml", "src/main.py"), "main.py", False, id="miss"),
+            pytest.param(("config.toml",), "config.tomlx", False, id="longer"),
+            pytest.param(("config.toml", "*.py"), "a.py", True, id="mixed"),
+        ],
+    )
+    def test_literal_patterns_match_exactly(
+        self, patterns: tuple[str, ...], path: str, *, expected: bool
+    ):
+        assert GlobMatcher().matches(path, include=patterns) is expected
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            pytest.param("test_a.py", True, id="prefix-match"),
+            pytest.param("src/test_a.txt", False, id="prefix-nested"),
+            pytest.param("a.py", True, id="suffix-match"),
+            pytest.param("src/a.py", False, id="suffix-nested"),
+            pytest.param("conftest.py", True, id="basename-root"),
+            pytest.param("a/b/conftest.py", True, id="basename-nested"),
+            pytest.param("a/xconftest.py", False, id="basename-partial"),
+            pytest.param("config.toml", True, id="literal"),
+            pytest.param("a/b.txt", True, id="regex-fallback"),
+            pytest.param("b.txt", False, id="no-match"),
+        ],
+    )
+    def test_simple_shapes_match_like_regex(self, path: str, *, expected: bool):
+        patterns = ("test_*", "*.py", "**/conftest.py", "config.toml", "*/b.txt")
+
+        assert GlobMatcher().matches(path, include=patterns) is expected
+
 
 class TestGlobMatcherBracketEscapes:
     def test_backslash_escape_in_bracket(self):
@@ -325,6 +401,104 @@ class TestGlobMatcherBracketEscapes:
         assert matcher.matches("a", include=[r"[a\-b]"])
 
 
+class TestGlobMatcherLiteralPrefix:
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            pytest.param("src/a.py", True, id="src-group"),
+            pytest.param("src/x/a.pyi", True, id="src-nested"),
+            pytest.param("docs/x", True, id="no-prefix-group"),
+            pytest.param("a/b/c", True, id="bracket-slash"),
+            pytest.param("srcx/a.py", False, id="prefix-not-a-directory"),
+            pytest.param("docs/a.py", False, id="other-directory"),
+        ],
+    )
+    def test_patterns_grouped_by_literal_directories(
+        self, path: str, *, expected: bool
+    ):
+        patterns = ["src/*.py", "src/**/*.pyi", "*/x", "a/b[/]c"]
+
+        assert GlobMatcher().matches(path, include=patterns) is expected
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            pytest.param("src/a", True, id="child"),
+            pytest.param("docs/a/b.md", True, id="nested"),
+            pytest.param("src", False, id="directory-itself"),
+            pytest.param("srcx/a", False, id="sibling"),
+        ],
+    )
+    def test_trailing_double_star_matches_contents(self, path: str, *, expected: bool):
+        assert GlobMatcher().matches(path, include=["src/**", "docs/**"]) is expected
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            pytest.param("src/a/b", True, id="double-star"),
+            pytest.param("src/a.py", True, id="single-star"),
+            pytest.param("src", False, id="directory-itself"),
+        ],
+    )
+    def test_mixed_endings_match_each_pattern(self, path: str, *, expected: bool):
+        assert GlobMatcher().matches(path, include=["src/**", "src/*.py"]) is expected
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [
+            pytest.param(["src/**"], id="trailing-double-star"),
+            pytest.param(["src/**", "src/*.py"], id="mixed-endings"),
+        ],
+    )
+    def test_double_star_does_not_match_newline_in_name(self, patterns: list[str]):
+        matcher = GlobMatcher()
+
+        assert not matcher.matches("src/a\nb/c.py", include=patterns)
+        assert matcher.matches("src/a/b/c.py", include=patterns)
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            pytest.param("src/main.py", True, id="prefix-and-rest-match"),
+            pytest.param("src/pkg/types.pyi", True, id="prefix-recursive"),
+            pytest.param("src/pkg/main.py", False, id="rest-mismatch"),
+            pytest.param("lib/main.py", False, id="prefix-mismatch"),
+            pytest.param("srcx/main.py", False, id="prefix-is-not-component"),
+            pytest.param("docs/api/index.md", True, id="nested-prefix"),
+        ],
+    )
+    def test_prefixed_patterns_match(self, path: str, *, expected: bool):
+        matcher = GlobMatcher()
+
+        include = ["src/*.py", "src/**/*.pyi", "docs/api/*.md"]
+        assert matcher.matches(path, include=include) is expected
+
+
+class TestGlobMatcherMatchesMany:
+    def test_matches_each_path_like_matches(self):
+        matcher = GlobMatcher()
+        paths = ["main.py", "test_main.py", "README.md", "src/app.py"]
+        include = ["*.py", "**/*.md"]
+        exclude = ["test_*"]
+
+        result = matcher.matches_many(paths, include=include, exclude=exclude)
+
+        assert result == [
+            matcher.matches(path, include=include, exclude=exclude) for path in paths
+        ]
+        assert result == [True, False, True, False]
+
+    def test_no_patterns_matches_all(self):
+        matcher = GlobMatcher()
+
+        assert matcher.matches_many(["a", "b/c"]) == [True, True]
+
+    def test_empty_batch_returns_empty(self):
+        matcher = GlobMatcher()
+
+        assert matcher.matches_many([], include=["*.py"]) == []
+
+
 class TestGlobMatcherProperties:
     def test_supports_negation_false(self):
         matcher = GlobMatcher()
@@ -1,8 +1,11 @@
+import dataclasses
+import os
 from pathlib import Path
 
 import pytest
 
 from searchpath import Match
+from searchpath._match import relative_path_str
 
 
 @pytest.mark.parametrize(
@@ -34,3 +37,52 @@ def test_relative_computes_path_relative_to_source(
     path = source.joinpath(*relative_parts)
     match = Match(path=path, scope="test", source=source)
     assert match.relative == expected
+
+
+def test_relative_under_filesystem_root():
+    match = Match(path=Path("/project/src/main.py"), scope="test", source=Path("/"))
+
+    assert match.relative == Path("project/src/main.py")
+
+
+def test_relative_of_source_itself():
+    match = Match(path=Path("/project"), scope="test", source=Path("/project"))
+
+    assert match.relative == Path()
+
+
+def test_relative_does_not_change_dataclass_shape():
+    first = Match(path=Path("/project/a"), scope="test", source=Path("/project"))
+    second = Match(path=Path("/project/a"), scope="test", source=Path("/project"))
+    _ = first.relative
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert [field.name for field in dataclasses.fields(Match)] == [
+        "path",
+        "scope",
+        "source",
+    ]
+    assert dataclasses.asdict(first) == {
+        "path": Path("/project/a"),
+        "scope": "test",
+        "source": Path("/project"),
+    }
+    assert dataclasses.astuple(first) == (Path("/project/a"), "test", Path("/project"))
+    assert repr(first) == (
+        f"Match(path={first.path!r}, scope='test', source={first.source!r})"
+    )
+
+
+@pytest.mark.parametrize(
+    ("path", "source", "expected"),
+    [
+        pytest.param("/project/src/a.py", "/project", "src/a.py", id="nested"),
+        pytest.param("/project/a.py", "/", "project/a.py", id="root-source"),
+        pytest.param("/project-x/a.py", "/project", None, id="name-prefix"),
+        pytest.param("/project", "/project", None, id="same-path"),
+    ],
+)
+@pytest.mark.skipif(os.sep != "/", reason="POSIX separators")
+def test_relative_path_str(path: str, source: str, expected: str | None):
+    assert relative_path_str(path, source) == expected
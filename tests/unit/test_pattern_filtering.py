@@ -49,6 +49,30 @@ class TestLoadPatterns:
 
         assert patterns == []
 
+    def test_reloads_modified_file(self, fake_tree: "TreeFactory"):
+        root = fake_tree({"patterns.txt": "*.py\n"})
+        path = root / "patterns.txt"
+        assert load_patterns(path) == ["*.py"]
+
+        _ = path.write_text("*.txt\n*.md\n", encoding="utf-8")
+
+        assert load_patterns(path) == ["*.txt", "*.md"]
+
+    def test_returns_independent_lists(self, fake_tree: "TreeFactory"):
+        root = fake_tree({"patterns.txt": "*.py\n"})
+        first = load_patterns(root / "patterns.txt")
+        first.append("*.txt")
+
+        assert load_patterns(root / "patterns.txt") == ["*.py"]
+
+    def test_patterns_are_interned(self, fake_tree: "TreeFactory"):
+        root = fake_tree({"a.txt": "*.py\n", "b.txt": "*.py\n"})
+
+        (first,) = load_patterns(root / "a.txt")
+        (second,) = load_patterns(root / "b.txt")
+
+        assert first is second
+
     def test_accepts_string_path(self, fake_tree: "TreeFactory"):
         root = fake_tree({"patterns.txt": "*.py"})
         patterns = load_patterns(str(root / "patterns.txt"))
@@ -79,14 +103,26 @@ class TestLoadPatterns:
     def test_permission_denied_raises_pattern_file_error_windows(
         self, mocker: "pytest_mock.MockerFixture"
     ):
-        # Mock Path.read_text to raise PermissionError before pyfakefs intercepts
-        _ = mocker.patch.object(Path, "read_text", side_effect=PermissionError)
+        # Mock Path.stat, the first filesystem access in load_patterns
+        _ = mocker.patch.object(Path, "stat", side_effect=PermissionError)
 
         with pytest.raises(PatternFileError) as exc_info:
             _ = load_patterns(Path("/fake/patterns.txt"))
 
         assert "permission denied" in exc_info.value.message
 
+    def test_permission_denied_on_read_raises_pattern_file_error(
+        self, fake_tree: "TreeFactory", mocker: "pytest_mock.MockerFixture"
+    ):
+        root = fake_tree({"unreadable.txt": "*.py"})
+        _ = mocker.patch("searchpath._traversal.os.open", side_effect=PermissionError)
+
+        with pytest.raises(PatternFileError) as exc_info:
+            _ = load_patterns(root / "unreadable.txt")
+
+        assert exc_info.value.path == root / "unreadable.txt"
+        assert "permission denied" in exc_info.value.message
+
     @pytest.mark.skipif(os.name == "nt", reason="Unix-specific error message")
     def test_is_directory_raises_pattern_file_error(self, fake_tree: "TreeFactory"):
         root = fake_tree({"patterns": {}})
@@ -1,7 +1,13 @@
+import re
+from typing import TYPE_CHECKING
+
 import pytest
 
 from searchpath import PatternSyntaxError, RegexMatcher
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 
 class TestRegexMatchingBasic:
     def test_exact_match(self):
@@ -137,6 +143,19 @@ class TestRegexMatchingAnchored:
         assert not matcher.matches("config.toml_suffix", include=["config.toml"])
         assert not matcher.matches("dir/config.toml", include=["config.toml"])
 
+    @pytest.mark.parametrize(
+        "include",
+        [
+            pytest.param(["config"], id="literal"),
+            pytest.param([r"conf\w+"], id="regex"),
+            pytest.param([r"conf\w+", r"src/\w+"], id="fused"),
+        ],
+    )
+    def test_trailing_newline_does_not_match(self, include: list[str]):
+        matcher = RegexMatcher()
+
+        assert not matcher.matches("config\n", include=include)
+
 
 class TestRegexMatcherIncludeExclude:
     def test_empty_include_matches_all(self):
@@ -181,6 +200,30 @@ class TestRegexMatcherIncludeExclude:
         assert not matcher.matches("main_test.py", exclude=["test_.*", ".*_test.py"])
         assert matcher.matches("main.py", exclude=["test_.*", ".*_test.py"])
 
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            pytest.param("src/main.py", True, id="included"),
+            pytest.param("src/setup.py", False, id="excluded"),
+            pytest.param("docs/main.md", False, id="not-included"),
+            pytest.param("docs/setup.py", False, id="neither"),
+        ],
+    )
+    def test_cheap_exclude_checked_first(self, path: str, *, expected: bool):
+        matcher = RegexMatcher()
+        include = [r"src/\w+\.py"]
+        exclude = [r"src/setup\.py"]
+
+        assert matcher.matches(path, include=include, exclude=exclude) == expected
+
+    def test_invalid_exclude_raises_when_include_misses(self):
+        matcher = RegexMatcher()
+
+        with pytest.raises(PatternSyntaxError) as exc_info:
+            _ = matcher.matches("a.txt", include=[r".*\.py"], exclude=["[invalid"])
+
+        assert exc_info.value.pattern == "[invalid"
+
 
 class TestRegexMatcherErrors:
     def test_empty_pattern_in_include_raises(self):
@@ -210,8 +253,249 @@ class TestRegexMatcherErrors:
         assert exc_info.value.pattern == "[invalid"
         assert exc_info.value.message  # Should have error message from re.error
 
+    def test_repeated_invalid_regex_raises_fresh_error_with_cause(self):
+        matcher = RegexMatcher()
+
+        with pytest.raises(PatternSyntaxError) as first:
+            _ = matcher.matches("a.py", include=["[invalid"])
+        with pytest.raises(PatternSyntaxError) as second:
+            _ = matcher.matches("b.py", include=["[invalid"])
+
+        assert first.value is not second.value
+        assert isinstance(second.value.__cause__, re.error)
+
+
+class TestRegexMatcherCache:
+    def test_compiled_patterns_shared_across_instances(self, mocker: "MockerFixture"):
+        _ = RegexMatcher().matches("a", include=[r"shared-cache-\w"])
+        spy = mocker.spy(re, "compile")
+
+        assert RegexMatcher().matches("shared-cache-b", include=[r"shared-cache-\w"])
+        assert spy.call_count == 0
+
+    def test_fused_patterns_reuse_individual_compiles(self, mocker: "MockerFixture"):
+        _ = RegexMatcher().matches("a", include=[r"reuse-\d"])
+        spy = mocker.spy(re, "compile")
+
+        _ = RegexMatcher().matches("a", include=[r"reuse-\d", r"reuse-\w"])
+        compiled = [call.args[0] for call in spy.call_args_list]
+        assert r"reuse-\d" not in compiled
+        assert r"reuse-\w" in compiled
+
+
+class TestRegexMatcherFusion:
+    def test_multiple_patterns_fused_into_one_regex(self, mocker: "MockerFixture"):
+        matcher = RegexMatcher()
+        include = [r"src/.*\.fused", r"docs/.*\.fused-md"]
+        spy = mocker.spy(re, "compile")
+
+        assert matcher.matches("src/main.fused", include=include)
+        assert matcher.matches("docs/index.fused-md", include=include)
+        assert not matcher.matches("src/main.fusedc", include=include)
+        alternations = [call for call in spy.call_args_list if "|" in call.args[0]]
+        assert len(alternations) == 1
+
+    def test_multiple_exclude_patterns_checked_together(self):
+        matcher = RegexMatcher()
+        exclude = [r"\w+_test\.py", r"tests?/\w+\.py"]
+
+        assert not matcher.matches("main_test.py", exclude=exclude)
+        assert not matcher.matches("tests/main.py", exclude=exclude)
+        assert matcher.matches("src/main.py", exclude=exclude)
+
+    def test_alternation_inside_pattern_stays_anchored(self):
+        matcher = RegexMatcher()
+
+        assert not matcher.matches("ab", include=["a|b", "c"])
+        assert matcher.matches("b", include=["a|b", "c"])
+
+    @pytest.mark.parametrize(
+        ("patterns", "matching", "non_matching"),
+        [
+            pytest.param((r"(a)\1", "b+"), "aa", "ab", id="numbered-backreference"),
+            pytest.param(("(?i)a", "b+"), "A", "B", id="inline-global-flag"),
+            pytest.param(("(?P<x>a)", "(?P<x>b)"), "b", "c", id="duplicate-group-name"),
+        ],
+    )
+    def test_unfusable_patterns_checked_individually(
+        self, patterns: tuple[str, str], matching: str, non_matching: str
+    ):
+        matcher = RegexMatcher()
+
+        assert matcher.matches(matching, include=patterns)
+        assert not matcher.matches(non_matching, include=patterns)
+
+    def test_invalid_pattern_after_valid_one_raises(self):
+        matcher = RegexMatcher()
+
+        with pytest.raises(PatternSyntaxError) as exc_info:
+            _ = matcher.matches("a.py", include=[r".*\.py", "[invalid"])
+
+        assert exc_info.value.pattern == "[invalid"
+
+
+class TestRegexMatcherLiterals:
+    @pytest.mark.parametrize(
+        ("pattern", "literal"),
+        [
+            pytest.param("src", "src", id="plain"),
+            pytest.param(r"config\.toml", "config.toml", id="escaped-dot"),
+            pytest.param(r"a\+b\\c", "a+b\\c", id="escaped-metachars"),
+        ],
+    )
+    def test_literal_patterns_match_exactly(self, pattern: str, literal: str):
+        matcher = RegexMatcher()
+
+        assert matcher.matches(literal, include=[pattern])
+        assert not matcher.matches(f"{literal}x", include=[pattern])
+        assert not matcher.matches(literal[:-1], include=[pattern])
+
+    @pytest.mark.parametrize(
+        ("pattern", "matching", "non_matching"),
+        [
+            pytest.param("config.toml", "configxtoml", "config", id="unescaped-dot"),
+            pytest.param(r"\d", "5", "d", id="escaped-class"),
+            pytest.param(r"a\b", "a", "ab", id="word-boundary"),
+        ],
+    )
+    def test_patterns_with_metachars_match_as_regex(
+        self, pattern: str, matching: str, non_matching: str
+    ):
+        matcher = RegexMatcher()
+
+        assert matcher.matches(matching, include=[pattern])
+        assert not matcher.matches(non_matching, include=[pattern])
+
+    def test_literals_and_regexes_combined(self):
+        matcher = RegexMatcher()
+
+        assert matcher.matches("README", include=["README", r".*\.py"])
+        assert matcher.matches("main.py", include=["README", r".*\.py"])
+        assert not matcher.matches("README.md", include=["README", r".*\.py"])
+
+
+class TestRegexMatcherAffixes:
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            pytest.param("test_a.txt", True, id="prefix"),
+            pytest.param("a.py", True, id="suffix"),
+            pytest.param("a_test.py", True, id="longer-suffix"),
+            pytest.param("src/test_a.txt", False, id="prefix-not-at-start"),
+            pytest.param("a.pyc", False, id="suffix-not-at-end"),
+        ],
+    )
+    def test_prefix_and_suffix_patterns(self, path: str, *, expected: bool):
+        matcher = RegexMatcher()
+        include = [r"test_.*", r".*\.py", r".*_test\.py"]
+
+        assert matcher.matches(path, include=include) == expected
+
+    def test_escaped_trailing_dot_is_not_a_prefix(self):
+        matcher = RegexMatcher()
+
+        assert matcher.matches("a...", include=[r"a\.*"])
+        assert matcher.matches("a", include=[r"a\.*"])
+        assert not matcher.matches("ab", include=[r"a\.*"])
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            pytest.param("main.py", True, id="suffix"),
+            pytest.param("test_main.txt", True, id="prefix"),
+            pytest.param("main.txt", False, id="neither"),
+            pytest.param("a\nb.py", False, id="newline-before-suffix"),
+            pytest.param("test_\nmain", False, id="newline-after-prefix"),
+            pytest.param("main\n.py", False, id="newline-in-wildcard-part"),
+            pytest.param("test_a.py\n", False, id="trailing-newline"),
+        ],
+    )
+    def test_affix_patterns_match_like_fullmatch(self, path: str, *, expected: bool):
+        matcher = RegexMatcher()
+
+        assert matcher.matches(path, include=[r"test_.*", r".*\.py"]) == expected
+
+    def test_newline_inside_literal_part_matches(self):
+        matcher = RegexMatcher()
+
+        assert matcher.matches("a\n.py", include=[".*\n\\.py"])
+
+
+class TestRegexMatcherCompiledPatterns:
+    def test_compiled_pattern_flags_respected(self):
+        matcher = RegexMatcher()
+        include = [re.compile("readme", re.IGNORECASE)]
+
+        assert matcher.matches("README", include=include)
+        assert not matcher.matches("README.md", include=include)
+
+    def test_compiled_and_string_patterns_mixed(self):
+        matcher = RegexMatcher()
+        include = [re.compile(r"src/\w+\.py"), "setup.py"]
+
+        assert matcher.matches("src/main.py", include=include)
+        assert matcher.matches("setup.py", include=include)
+        assert not matcher.matches("docs/index.md", include=include)
+
+    def test_compiled_exclude_pattern(self):
+        matcher = RegexMatcher()
+
+        assert not matcher.matches("test_a.py", exclude=[re.compile(r"test_.*")])
+        assert matcher.matches("a.py", exclude=[re.compile(r"test_.*")])
+
+    def test_compile_patterns_returns_reusable_patterns(self):
+        matcher = RegexMatcher()
+        include = matcher.compile_patterns([r".*\.py", "README"])
+
+        assert all(isinstance(pattern, re.Pattern) for pattern in include)
+        assert matcher.matches("main.py", include=include)
+        assert matcher.matches("README", include=include)
+        assert not matcher.matches("main.txt", include=include)
+
+    def test_compile_patterns_invalid_raises(self):
+        with pytest.raises(PatternSyntaxError) as exc_info:
+            _ = RegexMatcher.compile_patterns(["ok", "[invalid"])
+
+        assert exc_info.value.pattern == "[invalid"
+
+
+class TestRegexMatcherMatchesMany:
+    def test_matches_each_path_like_matches(self):
+        matcher = RegexMatcher()
+        paths = ["main.py", "test_main.py", "README", "src/app.py", "notes.txt"]
+        include = [r".*\.py", "README"]
+        exclude = [r"test_.*", r"src/.+"]
+
+        result = matcher.matches_many(paths, include=include, exclude=exclude)
+
+        assert result == [
+            matcher.matches(path, include=include, exclude=exclude) for path in paths
+        ]
+        assert result == [True, False, True, False, False]
+
+    def test_no_patterns_matches_all(self):
+        matcher = RegexMatcher()
+
+        assert matcher.matches_many(["a", "b/c"]) == [True, True]
+
+    def test_empty_batch_returns_empty(self):
+        matcher = RegexMatcher()
+
+        assert matcher.matches_many([], include=[r".*\.py"]) == []
+
+    def test_invalid_pattern_raises(self):
+        matcher = RegexMatcher()
+
+        with pytest.raises(PatternSyntaxError):
+            _ = matcher.matches_many([], exclude=["[invalid"])
+
 
 class TestRegexMatcherProperties:
+    def test_instances_have_no_dict(self):
+        matcher = RegexMatcher()
+
+        assert not hasattr(matcher, "__dict__")
+
     def test_supports_negation_false(self):
         matcher = RegexMatcher()
 
@@ -1,11 +1,14 @@
-from pathlib import Path
-from typing import TYPE_CHECKING
+import os
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, NamedTuple
 
 import pytest
 
 from searchpath import SearchPath
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from tests.conftest import TreeFactory
 
 
@@ -59,6 +62,12 @@ class TestEntryParsing:
 
         assert sp.scopes == ["dir0", "dir1"]
 
+    def test_repeated_bare_entry_gets_distinct_names(self):
+        path = Path("/same")
+        sp = SearchPath(path, path)
+
+        assert sp.scopes == ["dir0", "dir1"]
+
     def test_mixed_entries(self):
         sp = SearchPath(
             ("explicit", Path("/explicit")),
@@ -70,6 +79,39 @@ class TestEntryParsing:
 
         assert sp.scopes == ["explicit", "dir0", "dir1", "another"]
 
+    def test_scopes_are_interned(self):
+        scope = "".join(["us", "er"])
+        sp1 = SearchPath((scope, "/a"), "/b")
+        sp2 = SearchPath(("user", "/c"), "/d")
+
+        assert sp1.scopes[0] is sp2.scopes[0]
+        assert sp1.scopes[1] is sp2.scopes[1]
+
+    def test_auto_names_continue_past_precomputed_names(self):
+        entries = [f"/dir{i}" for i in range(300)]
+        sp1 = SearchPath(*entries)
+        sp2 = SearchPath(*entries)
+
+        assert sp1.scopes == [f"dir{i}" for i in range(300)]
+        assert all(a is b for a, b in zip(sp1.scopes, sp2.scopes, strict=True))
+
+    def test_string_entries_converted_once(self):
+        sp = SearchPath("/first", ("second", "/second"))
+
+        first = list(sp)
+        assert all(isinstance(path, Path) for path in first)
+        assert all(a is b for a, b in zip(first, sp, strict=True))
+
+    def test_named_tuple_entry(self):
+        class Scoped(NamedTuple):
+            scope: str
+            path: str
+
+        sp = SearchPath(Scoped("user", "/home/user"), "/bare")
+
+        assert sp.scopes == ["user", "dir0"]
+        assert list(sp) == [Path("/home/user"), Path("/bare")]
+
     def test_empty_searchpath(self):
         sp = SearchPath()
 
@@ -95,6 +137,40 @@ class TestWithSuffix:
 
         assert list(sp2) == [Path("/home/user/.config/myapp")]
 
+    def test_string_and_path_entries(self):
+        sp = SearchPath(("user", "/home/user"), ("system", Path("/etc")))
+        sp2 = sp.with_suffix(".config", "myapp")
+
+        assert list(sp2) == [
+            Path("/home/user/.config/myapp"),
+            Path("/etc/.config/myapp"),
+        ]
+
+    def test_keeps_pure_path_type(self):
+        entry = ("posix", PurePosixPath("/home/user"))
+        sp = SearchPath(entry)  # pyright: ignore[reportArgumentType]
+        sp2 = sp.with_suffix(".config")
+
+        assert list(sp2) == [PurePosixPath("/home/user/.config")]
+        assert type(next(iter(sp2))) is PurePosixPath
+
+    def test_stores_normalized_paths(self, tmp_path: Path):
+        file_path = tmp_path / "file.txt"
+        _ = file_path.write_text("")
+
+        sp = SearchPath(("str", str(tmp_path)), ("path", tmp_path))
+        sp2 = sp.with_suffix("file.txt", "")
+
+        assert list(sp2) == [file_path, file_path]
+        assert sp2.existing().scopes == ["str", "path"]
+
+    def test_no_parts_copies_entries(self):
+        sp = SearchPath(("user", "/home/user"))
+        sp2 = sp.with_suffix()
+
+        assert sp2 is not sp
+        assert list(sp2) == [Path("/home/user")]
+
     def test_preserves_scopes(self):
         sp = SearchPath(("user", Path("/user")), ("system", Path("/sys")))
         sp2 = sp.with_suffix("data")
@@ -147,6 +223,18 @@ class TestAdd:
 
         assert list(combined) == [Path("/b")]
 
+    def test_add_empty_returns_other_operand(self):
+        sp = SearchPath(("a", Path("/a")))
+
+        assert sp + SearchPath() is sp
+        assert SearchPath() + sp is sp
+
+    def test_keeps_auto_named_scopes(self):
+        combined = SearchPath("/a") + SearchPath("/b")
+
+        assert combined.scopes == ["dir0", "dir0"]
+        assert list(combined) == [Path("/a"), Path("/b")]
+
     def test_add_non_searchpath_returns_not_implemented(self):
         sp = SearchPath(("a", Path("/a")))
         result = sp.__add__([Path("/b")])
@@ -174,6 +262,15 @@ class TestFilter:
 
         assert not filtered
 
+    def test_filter_passes_paths_for_string_entries(self):
+        sp = SearchPath(("a", "/a"), ("b", "/b"))
+        seen: list[object] = []
+        filtered = sp.filter(lambda p: seen.append(p) or p.name == "b")
+
+        assert seen == [Path("/a"), Path("/b")]
+        assert all(isinstance(path, Path) for path in seen)
+        assert filtered.scopes == ["b"]
+
     def test_filter_does_not_mutate_original(self):
         sp = SearchPath(("a", Path("/a")), ("b", Path("/b")))
         original_dirs = list(sp)
@@ -204,6 +301,75 @@ class TestExisting:
 
         assert not filtered
 
+    def test_existing_keeps_string_entries_and_files(self, fake_tree: "TreeFactory"):
+        root = fake_tree({"exists": {}, "file.txt": ""})
+
+        sp = SearchPath(
+            ("dir", str(root / "exists")),
+            ("file", str(root / "file.txt")),
+            ("missing", str(root / "missing")),
+        )
+        filtered = sp.existing()
+
+        assert list(filtered) == [root / "exists", root / "file.txt"]
+        assert filtered.scopes == ["dir", "file"]
+
+    def test_existing_checks_normalized_string_entries(self, tmp_path: Path):
+        file_path = tmp_path / "file.txt"
+        _ = file_path.write_text("")
+
+        sp = SearchPath(("cwd", ""), ("file", f"{file_path}/"))
+        filtered = sp.existing()
+
+        assert filtered.scopes == ["cwd", "file"]
+        assert list(filtered) == [Path(), file_path]
+
+    def test_existing_checks_repeated_entries_once(
+        self, tmp_path: Path, mocker: "MockerFixture"
+    ):
+        spy = mocker.spy(os, "stat")
+
+        sp = SearchPath(("a", tmp_path), ("b", str(tmp_path)))
+        filtered = sp.existing()
+
+        assert filtered.scopes == ["a", "b"]
+        assert spy.call_count == 1
+
+    def test_existing_with_predicate_skips_rejected_entries(
+        self, tmp_path: Path, mocker: "MockerFixture"
+    ):
+        spy = mocker.spy(os, "stat")
+
+        sp = SearchPath(
+            ("keep", tmp_path),
+            ("skip", tmp_path / "skip"),
+            ("missing", tmp_path / "missing"),
+        )
+        filtered = sp.existing(lambda p: p.name != "skip")
+
+        assert filtered.scopes == ["keep"]
+        assert [call.args[0] for call in spy.call_args_list] == [
+            os.fspath(tmp_path),
+            os.fspath(tmp_path / "missing"),
+        ]
+
+    def test_existing_with_max_workers_keeps_order(self, tmp_path: Path):
+        for name in ("a", "c", "e"):
+            (tmp_path / name).mkdir()
+        sp = SearchPath(*((name, tmp_path / name) for name in "abcdea"))
+
+        filtered = sp.existing(max_workers=4)
+
+        assert filtered.scopes == ["a", "c", "e", "a"]
+        assert list(filtered) == list(sp.existing())
+
+    @pytest.mark.parametrize("max_workers", [0, -1])
+    def test_existing_rejects_invalid_max_workers(self, max_workers: int):
+        sp = SearchPath(("a", Path("/a")))
+
+        with pytest.raises(ValueError, match="max_workers"):
+            _ = sp.existing(max_workers=max_workers)
+
 
 class TestIteration:
     def test_iter_yields_paths(self):
@@ -226,6 +392,15 @@ class TestIteration:
 
         assert sp.scopes == ["a", "b"]
 
+    def test_returned_lists_are_copies(self):
+        sp = SearchPath(("a", Path("/a")), ("b", "/b"))
+
+        sp.scopes.append("c")
+        sp.dirs.append(Path("/c"))
+
+        assert sp.scopes == ["a", "b"]
+        assert sp.dirs == [Path("/a"), Path("/b")]
+
     def test_iteration_preserves_order(self):
         paths = [Path(f"/path{i}") for i in range(10)]
         entries = [(f"scope{i}", p) for i, p in enumerate(paths)]
@@ -287,3 +462,33 @@ class TestStrAndRepr:
         sp = SearchPath()
 
         assert repr(sp) == "SearchPath()"
+
+    def test_str_and_repr_computed_once(self):
+        sp = SearchPath(("user", "/home/user"))
+
+        first_str = str(sp)
+        first_repr = repr(sp)
+
+        assert str(sp) is first_str
+        assert repr(sp) is first_repr
+
+    def test_derived_searchpath_formats_own_entries(self):
+        sp = SearchPath(("user", Path("/home/user")))
+        _ = str(sp), repr(sp)
+        sp2 = sp.with_suffix(".config")
+
+        assert str(sp2) == "user: /home/user/.config"
+        assert "/home/user/.config" in repr(sp2)
+
+
+class TestSlots:
+    @pytest.mark.parametrize(
+        "sp",
+        [
+            pytest.param(SearchPath(("a", Path("/a"))), id="constructed"),
+            pytest.param(SearchPath("/a") + SearchPath("/b"), id="concatenated"),
+            pytest.param(SearchPath("/a").with_suffix("b"), id="with-suffix"),
+        ],
+    )
+    def test_instances_have_no_dict(self, sp: SearchPath):
+        assert not hasattr(sp, "__dict__")